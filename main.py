@@ -11,66 +11,17 @@ import sys
 import signal
 import argparse
 import logging
-from logging.handlers import RotatingFileHandler
-import traceback
 
-from src.container import Container
-
-
-# Configuração inicial de logging
-def setup_logging(log_level: str, log_file: str = None) -> None:
-    """
-    Configura o sistema de logging com o nível especificado.
-    
-    Args:
-        log_level: Nível de logging (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        log_file: Caminho opcional para arquivo de log
-    """
-    numeric_level = getattr(logging, log_level.upper(), None)
-    if not isinstance(numeric_level, int):
-        raise ValueError(f"Nível de log inválido: {log_level}")
-    
-    # Formato do log
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    
-    # Configuração básica
-    handlers = []
-    
-    # Handler para console
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter(log_format))
-    handlers.append(console_handler)
-    
-    # Handler para arquivo, se especificado
-    if log_file:
-        file_handler = RotatingFileHandler(
-            log_file, maxBytes=10*1024*1024, backupCount=5
-        )
-        file_handler.setFormatter(logging.Formatter(log_format))
-        handlers.append(file_handler)
-    
-    # Configurar o logging
-    logging.basicConfig(
-        level=numeric_level,
-        format=log_format,
-        handlers=handlers
-    )
-    
-    logger = logging.getLogger()
-    logger.setLevel(numeric_level)
-    
-    # Silenciar logs muito verbosos
-    logging.getLogger('httpx').setLevel(logging.WARNING)
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
+from src.config.logging_config import LOG_LEVELS, configure_logging
 
 
 # Handler para sinais de interrupção
-def setup_signal_handlers(container) -> None:
+def setup_signal_handlers() -> None:
     """
     Configura os handlers para sinais do sistema.
     
-    Args:
-        container: Contêiner de dependências
+    Não depende do contêiner, para poder ser instalado antes da
+    inicialização e permitir encerrar a aplicação durante a carga.
     """
     def signal_handler(sig, frame):
         logging.info("Sinal de interrupção recebido. Encerrando aplicação...")
@@ -91,21 +42,23 @@ def check_environment() -> None:
     """
     required_vars = ['CLAUDE_API_KEY']
     
+    environ = os.environ
     for var in required_vars:
-        if not os.getenv(var):
-            logging.error(
-                f"Variável de ambiente obrigatória não configurada: {var}"
-            )
+        if not environ.get(var):
             raise EnvironmentError(
                 f"A variável de ambiente {var} é obrigatória. "
                 f"Por favor, adicione-a ao arquivo .env ou ao ambiente."
             )
 
 
-# Função principal
-def main():
-    """Função principal para iniciar a aplicação FLIPFLOPS."""
-    # Configurar parser de argumentos
+# Parser de argumentos
+def build_arg_parser():
+    """
+    Constrói o parser de argumentos da linha de comando.
+    
+    Returns:
+        Parser de argumentos da aplicação
+    """
     parser = argparse.ArgumentParser(
         description='FLIPFLOPS - Ferramenta para Leitura Inteligente e '
                     'Preparação para Processos Seletivos'
@@ -129,7 +82,7 @@ def main():
         '--log-level', 
         type=str, 
         default='INFO',
-        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+        choices=list(LOG_LEVELS),
         help='Nível de logging'
     )
     
@@ -139,21 +92,34 @@ def main():
         help='Arquivo para salvar logs'
     )
     
+    return parser
+
+
+# Função principal
+def main():
+    """Função principal para iniciar a aplicação FLIPFLOPS."""
     # Parse dos argumentos
-    args = parser.parse_args()
+    args = build_arg_parser().parse_args()
+    
+    # Verificar ambiente antes de qualquer inicialização: sem a chave da API
+    # não há o que fazer, então o processo termina imediatamente
+    try:
+        check_environment()
+    except EnvironmentError as e:
+        print(f"\nERRO: {e}\n", file=sys.stderr)
+        sys.exit(1)
     
     try:
         # Configurar logging
-        setup_logging(args.log_level, args.log_file)
+        configure_logging(args.log_level, args.log_file)
         logging.info("Iniciando FLIPFLOPS...")
         
-        # Verificar ambiente
-        try:
-            check_environment()
-        except EnvironmentError as e:
-            logging.error(f"Erro de ambiente: {e}")
-            print(f"\nERRO: {e}\n")
-            sys.exit(1)
+        # Configurar handlers de sinais antes da inicialização pesada
+        setup_signal_handlers()
+        
+        # Importado apenas aqui para que --help e erros de ambiente não
+        # carreguem as dependências
+        from src.container import Container
         
         # Criar e inicializar container
         container = Container(
@@ -161,9 +127,6 @@ def main():
             data_dir=args.data_dir
         )
         
-        # Configurar handlers de sinais
-        setup_signal_handlers(container)
-        
         # Obter interface CLI
         cli = container.get_cli()
         
@@ -176,8 +139,7 @@ def main():
     except KeyboardInterrupt:
         logging.info("Aplicação encerrada pelo usuário.")
     except Exception as e:
-        logging.error(f"Erro fatal: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Erro fatal: %s", e)
         print(f"\nERRO FATAL: {str(e)}")
         print("Verifique os logs para mais detalhes.")
         sys.exit(1)
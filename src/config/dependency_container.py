@@ -7,46 +7,45 @@ and their initialization.
 import os
 import logging
 import configparser
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
-from src.infrastructure.ui.command_line_interface import CommandLineInterface
-from src.http.controllers.main_controller import MainController
+from src.config.model_cache import (
+    EMBEDDING_MODEL_NAME, model_snapshot_dir, prefer_local_model_cache
+)
+from src.infrastructure.repositories.json_file import read_json, write_json
 
-from src.usecases.question_answering_usecase import QuestionAnsweringUseCase
-from src.usecases.exam_generation_usecase import ExamGenerationUseCase
-from src.usecases.conversation_management_usecase import ConversationManagementUseCase
-from src.usecases.response_generation_usecase import ResponseGenerationUseCase
-from src.usecases.query_processing_usecase import QueryProcessingUseCase
+if TYPE_CHECKING:
+    from src.infrastructure.ui.command_line_interface import CommandLineInterface
+    from src.interfaces.services.llm_service import LLMService
+    from src.interfaces.services.query_service import QueryService
+    from src.interfaces.services.embedding_service import EmbeddingService
 
-from src.interfaces.services.llm_service import LLMService
-from src.interfaces.services.query_service import QueryService
-from src.interfaces.services.embedding_service import EmbeddingService
-
-from src.interfaces.repositories.document_repository import DocumentRepository
-from src.interfaces.repositories.embedding_repository import EmbeddingRepository
-from src.interfaces.repositories.conversation_repository import ConversationRepository
-from src.interfaces.repositories.topic_repository import TopicRepository
-
-from src.infrastructure.services.claude_llm_service import ClaudeLLMService
-from src.infrastructure.services.claude_query_service import ClaudeQueryService
-from src.infrastructure.services.faiss_embedding_service import FAISSEmbeddingService
-
-from src.infrastructure.repositories.pdf_document_repository import PDFDocumentRepository
-from src.infrastructure.repositories.faiss_embedding_repository import FAISSEmbeddingRepository
-from src.infrastructure.repositories.file_conversation_repository import FileConversationRepository
-from src.infrastructure.repositories.file_topic_repository import FileTopicRepository
-
-# MCP components
-from src.mcp.model import FlipflopsModel
-from src.mcp.context import FlipflopsContext
-from src.mcp.protocol import FlipflopsProtocol
-from src.mcp.route import FlipflopsRoute
+__all__ = ["DependencyContainer", "initialize_container"]
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 
+class _LazyService:
+    """
+    Proxy that resolves a service on first attribute access.
+    
+    Lets use cases be wired up front while the underlying service is only
+    constructed when one of its methods is actually called.
+    """
+    
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._instance = None
+    
+    def __getattr__(self, name: str) -> Any:
+        if self._instance is None:
+            self._instance = self._factory()
+        return getattr(self._instance, name)
+
+
 class DependencyContainer:
     """
     Container for managing application dependencies.
@@ -57,6 +56,12 @@ class DependencyContainer:
     3. Providing access to initialized components
     """
     
+    # Subdirectories of the data directory, in attribute order
+    DATA_SUBDIRS = ("documents", "embeddings", "conversations", "topics")
+    
+    # Default name of the MCP context file inside the data directory
+    CONTEXT_FILE_NAME = "FLIPFLOP.md"
+    
     def __init__(self, config_file: str, data_dir: str):
         """
         Initialize the dependency container.
@@ -67,37 +72,46 @@ class DependencyContainer:
         """
         self.config_file = config_file
         self.data_dir = data_dir
+        
+        # Paths derived from the data directory, computed once
+        base = Path(data_dir)
+        self._default_context_file = str(base / self.CONTEXT_FILE_NAME)
+        self.docs_dir, self.embeddings_dir, self.conversations_dir, self.topics_dir = (
+            str(base / name) for name in self.DATA_SUBDIRS
+        )
+        
         self.config = self._load_config()
         
         # Create subdirectories
-        self.docs_dir = os.path.join(data_dir, "documents")
-        self.embeddings_dir = os.path.join(data_dir, "embeddings")
-        self.conversations_dir = os.path.join(data_dir, "conversations")
-        self.topics_dir = os.path.join(data_dir, "topics")
+        self._create_data_dirs()
         
-        for directory in [self.docs_dir, self.embeddings_dir, 
-                         self.conversations_dir, self.topics_dir]:
-            os.makedirs(directory, exist_ok=True)
-        
-        # Initialize components
-        self._init_repositories()
+        # Register components; each one is built on first request
         self._init_services()
-        self._init_usecases()
-        self._init_mcp_components()
-        self._init_controllers()
-        self._init_ui()
+        self._init_lazy_graph()
         
         logger.info("Dependency container initialized")
     
+    def _create_data_dirs(self) -> None:
+        """
+        Create the data subdirectories.
+        
+        makedirs runs on every start, so a directory deleted since the last
+        run is created again.
+        """
+        for directory in (self.docs_dir, self.embeddings_dir,
+                          self.conversations_dir, self.topics_dir):
+            os.makedirs(directory, exist_ok=True)
+    
     def _load_config(self) -> Dict[str, Any]:
         """
         Load configuration from the config file.
         
+        The parsed result is cached next to the config file and reused as
+        long as the file's mtime and size are unchanged.
+        
         Returns:
             A dictionary with configuration values
         """
-        config = {}
-        
         # Check if config file exists
         if not os.path.exists(self.config_file):
             logger.warning(
@@ -105,36 +119,102 @@ class DependencyContainer:
             )
             return self._create_default_config()
         
+        stat = os.stat(self.config_file)
+        cache_key = (stat.st_mtime_ns, stat.st_size, self.data_dir)
+        
+        config = self._read_config_cache(cache_key)
+        if config is not None:
+            logger.info(f"Loaded cached configuration for {self.config_file}")
+            return config
+        
         # Load config from file
         try:
-            parser = configparser.ConfigParser()
-            parser.read(self.config_file)
-            
-            # API settings
-            if "API" in parser:
-                config["api_key"] = parser.get("API", "api_key", fallback="")
-                config["api_url"] = parser.get(
-                    "API", "api_url", 
-                    fallback="https://api.anthropic.com/v1/messages"
-                )
-                config["api_model"] = parser.get(
-                    "API", "api_model", fallback="claude-3-haiku-20240307"
-                )
-            
-            # Application settings
-            if "APP" in parser:
-                config["max_tokens"] = parser.getint("APP", "max_tokens", fallback=1000)
-                config["temperature"] = parser.getfloat("APP", "temperature", fallback=0.7)
-                config["context_file"] = parser.get(
-                    "APP", "context_file", 
-                    fallback=os.path.join(self.data_dir, "FLIPFLOP.md")
-                )
-            
-            logger.info(f"Loaded configuration from {self.config_file}")
-            return config
-        except Exception as e:
+            config = self._parse_config_file()
+        except (OSError, ValueError, configparser.Error) as e:
             logger.exception(f"Error loading config: {e}")
             return self._create_default_config()
+        
+        self._write_config_cache(cache_key, config)
+        logger.info(f"Loaded configuration from {self.config_file}")
+        return config
+    
+    def _parse_config_file(self) -> Dict[str, Any]:
+        """
+        Parse the config file into a configuration dictionary.
+        
+        Returns:
+            A dictionary with configuration values
+            
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If a numeric setting is malformed
+            configparser.Error: If the file is not valid INI
+        """
+        parser = configparser.ConfigParser()
+        with open(self.config_file, "r", encoding="utf-8") as f:
+            parser.read_file(f)
+        
+        config = {}
+        
+        # API settings
+        if "API" in parser:
+            config["api_key"] = parser.get("API", "api_key", fallback="")
+            config["api_url"] = parser.get(
+                "API", "api_url", 
+                fallback="https://api.anthropic.com/v1/messages"
+            )
+            config["api_model"] = parser.get(
+                "API", "api_model", fallback="claude-3-haiku-20240307"
+            )
+        
+        # Application settings
+        if "APP" in parser:
+            config["max_tokens"] = parser.getint("APP", "max_tokens", fallback=1000)
+            config["temperature"] = parser.getfloat("APP", "temperature", fallback=0.7)
+            config["context_file"] = parser.get(
+                "APP", "context_file", fallback=self._default_context_file
+            )
+        
+        return config
+    
+    @property
+    def _config_cache_path(self) -> str:
+        """Path of the parsed-config cache file."""
+        return f"{self.config_file}.cache"
+    
+    def _read_config_cache(self, cache_key: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Read the cached configuration if it matches the given key.
+        
+        Args:
+            cache_key: Tuple identifying the current state of the config file
+            
+        Returns:
+            The cached configuration, or None on a miss
+        """
+        try:
+            cached = read_json(self._config_cache_path)
+            stored_key, config = cached["key"], cached["config"]
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        
+        # JSON has no tuples, so the key comes back as a list
+        if stored_key != list(cache_key) or not isinstance(config, dict):
+            return None
+        return config
+    
+    def _write_config_cache(self, cache_key: tuple, config: Dict[str, Any]) -> None:
+        """
+        Atomically write the parsed configuration cache.
+        
+        Args:
+            cache_key: Tuple identifying the current state of the config file
+            config: Parsed configuration to cache
+        """
+        try:
+            write_json(self._config_cache_path, {"key": list(cache_key), "config": config})
+        except OSError as e:
+            logger.warning(f"Could not write config cache: {e}")
     
     def _create_default_config(self) -> Dict[str, Any]:
         """
@@ -149,7 +229,7 @@ class DependencyContainer:
             "api_model": "claude-3-haiku-20240307",
             "max_tokens": 1000,
             "temperature": 0.7,
-            "context_file": os.path.join(self.data_dir, "FLIPFLOP.md")
+            "context_file": self._default_context_file
         }
         
         # Try to save default config
@@ -167,47 +247,130 @@ class DependencyContainer:
         Args:
             config: Configuration dictionary to save
         """
-        parser = configparser.ConfigParser()
+        # The layout is fixed, so the file is written from a single template
+        content = (
+            "[API]\n"
+            f"api_key = {config['api_key']}\n"
+            f"api_url = {config['api_url']}\n"
+            f"api_model = {config['api_model']}\n"
+            "\n"
+            "[APP]\n"
+            f"max_tokens = {config['max_tokens']}\n"
+            f"temperature = {config['temperature']}\n"
+            f"context_file = {config['context_file']}\n"
+        )
         
-        # API section
-        parser["API"] = {
-            "api_key": config["api_key"],
-            "api_url": config["api_url"],
-            "api_model": config["api_model"]
-        }
+        # Save to file
+        with open(self.config_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        
+        logger.info(f"Saved default configuration to {self.config_file}")
+    
+    def _init_lazy_graph(self) -> None:
+        """
+        Register the factory for every component of the application.
         
-        # APP section
-        parser["APP"] = {
-            "max_tokens": str(config["max_tokens"]),
-            "temperature": str(config["temperature"]),
-            "context_file": config["context_file"]
+        Nothing is built here; each component is created by get() the first
+        time it is requested, together with whatever it depends on.
+        """
+        self._instances: Dict[str, Any] = {}
+        self._factories: Dict[str, Callable[[], Any]] = {
+            # Repositories
+            "document_repository": self._build_document_repository,
+            "embedding_repository": self._build_embedding_repository,
+            "conversation_repository": self._build_conversation_repository,
+            "topic_repository": self._build_topic_repository,
+            
+            # Services
+            "llm_service": self._build_llm_service,
+            "query_service": self._build_query_service,
+            "embedding_service": self._build_embedding_service,
+            
+            # Use cases
+            "response_generation_usecase": self._build_response_generation_usecase,
+            "query_processing_usecase": self._build_query_processing_usecase,
+            "conversation_management_usecase": self._build_conversation_management_usecase,
+            "question_answering_usecase": self._build_question_answering_usecase,
+            "exam_generation_usecase": self._build_exam_generation_usecase,
+            
+            # MCP components
+            "mcp_model": self._build_mcp_model,
+            "mcp_context": self._build_mcp_context,
+            "mcp_protocol": self._build_mcp_protocol,
+            "mcp_route": self._build_mcp_route,
+            
+            # Controllers and UI
+            "main_controller": self._build_main_controller,
+            "cli_interface": self._build_cli_interface,
         }
+    
+    def get(self, name: str) -> Any:
+        """
+        Get a component by name, building it on first request.
         
-        # Save to file
-        with open(self.config_file, 'w') as f:
-            parser.write(f)
+        Args:
+            name: Name of the component
+            
+        Returns:
+            The component instance
+            
+        Raises:
+            KeyError: If no component is registered under that name
+        """
+        try:
+            return self._instances[name]
+        except KeyError:
+            pass
         
-        logger.info(f"Saved default configuration to {self.config_file}")
+        factory = self._factories.get(name)
+        if factory is None:
+            raise KeyError(f"Unknown dependency: {name}")
+        
+        instance = self._instances[name] = factory()
+        return instance
+    
+    def __getattr__(self, name: str) -> Any:
+        """Resolve registered components as attributes (e.g. container.llm_service)."""
+        factories = self.__dict__.get("_factories")
+        if factories is None or name not in factories:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        return self.get(name)
+    
+    def _lazy(self, name: str) -> _LazyService:
+        """Proxy for a component that is only built when first used."""
+        return _LazyService(lambda: self.get(name))
     
-    def _init_repositories(self) -> None:
-        """Initialize all repositories."""
-        # Document repository
-        self.document_repository = PDFDocumentRepository(self.docs_dir)
+    # Repositories
+    
+    def _build_document_repository(self) -> Any:
+        from src.infrastructure.repositories.pdf_document_repository import PDFDocumentRepository
+        
+        return PDFDocumentRepository(self.docs_dir)
+    
+    def _build_embedding_repository(self) -> Any:
+        from src.infrastructure.repositories.faiss_embedding_repository import FAISSEmbeddingRepository
         
-        # Embedding repository
-        self.embedding_repository = FAISSEmbeddingRepository(self.embeddings_dir)
+        return FAISSEmbeddingRepository(self.embeddings_dir)
+    
+    def _build_conversation_repository(self) -> Any:
+        from src.infrastructure.repositories.file_conversation_repository import FileConversationRepository
         
-        # Conversation repository
-        self.conversation_repository = FileConversationRepository(
+        return FileConversationRepository(
             self.conversations_dir, 
             self.config["context_file"]
         )
+    
+    def _build_topic_repository(self) -> Any:
+        from src.infrastructure.repositories.file_topic_repository import FileTopicRepository
         
-        # Topic repository
-        self.topic_repository = FileTopicRepository(self.topics_dir)
+        return FileTopicRepository(self.topics_dir)
+    
+    # Services
     
     def _init_services(self) -> None:
-        """Initialize all services."""
+        """Resolve the API key shared by the LLM services."""
         # Check if API key is set
         api_key = self.config.get("api_key", "")
         if not api_key:
@@ -217,124 +380,164 @@ class DependencyContainer:
                     "CLAUDE_API_KEY not found in config or environment variables. "
                     "LLM services will not work properly."
                 )
+        self._api_key = api_key
+    
+    def _build_llm_service(self) -> "LLMService":
+        from src.infrastructure.services.claude_llm_service import ClaudeLLMService
         
-        # LLM service
-        self.llm_service = ClaudeLLMService(
-            api_key=api_key,
+        return ClaudeLLMService(
+            api_key=self._api_key,
             api_url=self.config.get("api_url"),
             model=self.config.get("api_model"),
             max_tokens=self.config.get("max_tokens", 1000),
             temperature=self.config.get("temperature", 0.7)
         )
+    
+    def _build_query_service(self) -> "QueryService":
+        from src.infrastructure.services.claude_query_service import ClaudeQueryService
         
-        # Query service
-        self.query_service = ClaudeQueryService(
-            api_key=api_key,
+        return ClaudeQueryService(
+            api_key=self._api_key,
             api_url=self.config.get("api_url"),
             model=self.config.get("api_model"),
             max_tokens=self.config.get("max_tokens", 1000),
             temperature=self.config.get("temperature", 0.7)
         )
+    
+    def _build_embedding_service(self) -> "EmbeddingService":
+        # Must run before sentence-transformers (and huggingface_hub) is imported
+        prefer_local_model_cache(EMBEDDING_MODEL_NAME)
+        
+        # Loads the SBERT model, so this only runs when embeddings are needed
+        from src.infrastructure.services.faiss_embedding_service import FAISSEmbeddingService
         
-        # Embedding service
-        self.embedding_service = FAISSEmbeddingService(
-            model_name="sentence-transformers/distiluse-base-multilingual-cased-v1"
+        return FAISSEmbeddingService(
+            model_name=EMBEDDING_MODEL_NAME,
+            snapshot_dir=model_snapshot_dir()
         )
     
-    def _init_usecases(self) -> None:
-        """Initialize all use cases."""
-        # Response generation use case
-        self.response_generation_usecase = ResponseGenerationUseCase(
-            llm_service=self.llm_service
-        )
+    # Use cases
+    # Services are handed over as proxies so they stay unbuilt until used.
+    
+    def _build_response_generation_usecase(self) -> Any:
+        from src.usecases.response_generation_usecase import ResponseGenerationUseCase
         
-        # Query processing use case
-        self.query_processing_usecase = QueryProcessingUseCase(
-            query_service=self.query_service,
-            embedding_service=self.embedding_service,
-            document_repository=self.document_repository,
-            embedding_repository=self.embedding_repository
+        return ResponseGenerationUseCase(
+            llm_service=self._lazy("llm_service")
         )
-        
-        # Conversation management use case
-        self.conversation_management_usecase = ConversationManagementUseCase(
-            conversation_repository=self.conversation_repository
+    
+    def _build_query_processing_usecase(self) -> Any:
+        from src.usecases.query_processing_usecase import QueryProcessingUseCase
+        
+        return QueryProcessingUseCase(
+            query_service=self._lazy("query_service"),
+            embedding_service=self._lazy("embedding_service"),
+            document_repository=self.get("document_repository"),
+            embedding_repository=self.get("embedding_repository")
         )
+    
+    def _build_conversation_management_usecase(self) -> Any:
+        from src.usecases.conversation_management_usecase import ConversationManagementUseCase
         
-        # Question answering use case
-        self.question_answering_usecase = QuestionAnsweringUseCase(
-            query_processing=self.query_processing_usecase,
-            response_generation=self.response_generation_usecase,
-            conversation_management=self.conversation_management_usecase
+        return ConversationManagementUseCase(
+            conversation_repository=self.get("conversation_repository")
         )
+    
+    def _build_question_answering_usecase(self) -> Any:
+        from src.usecases.question_answering_usecase import QuestionAnsweringUseCase
         
-        # Exam generation use case
-        self.exam_generation_usecase = ExamGenerationUseCase(
-            llm_service=self.llm_service,
-            query_service=self.query_service,
-            embedding_service=self.embedding_service,
-            document_repository=self.document_repository,
-            topic_repository=self.topic_repository
+        return QuestionAnsweringUseCase(
+            query_processing=self.get("query_processing_usecase"),
+            response_generation=self.get("response_generation_usecase"),
+            conversation_management=self.get("conversation_management_usecase")
         )
     
-    def _init_mcp_components(self) -> None:
-        """Initialize MCP components."""
-        # Model component
-        self.mcp_model = FlipflopsModel(
-            question_answering_usecase=self.question_answering_usecase,
-            exam_generation_usecase=self.exam_generation_usecase,
-            conversation_management_usecase=self.conversation_management_usecase
+    def _build_exam_generation_usecase(self) -> Any:
+        from src.usecases.exam_generation_usecase import ExamGenerationUseCase
+        
+        return ExamGenerationUseCase(
+            llm_service=self._lazy("llm_service"),
+            query_service=self._lazy("query_service"),
+            embedding_service=self._lazy("embedding_service"),
+            document_repository=self.get("document_repository"),
+            topic_repository=self.get("topic_repository")
         )
+    
+    # MCP components
+    
+    def _build_mcp_model(self) -> Any:
+        from src.mcp.model import FlipflopsModel
         
-        # Context component
-        self.mcp_context = FlipflopsContext(
-            conversation_repository=self.conversation_repository
+        return FlipflopsModel(
+            question_answering_usecase=self._lazy("question_answering_usecase"),
+            exam_generation_usecase=self._lazy("exam_generation_usecase"),
+            conversation_management_usecase=self.get("conversation_management_usecase")
         )
+    
+    def _build_mcp_context(self) -> Any:
+        from src.mcp.context import FlipflopsContext
         
-        # Protocol component
-        self.mcp_protocol = FlipflopsProtocol(
-            model=self.mcp_model,
-            context=self.mcp_context
+        return FlipflopsContext(
+            conversation_repository=self.get("conversation_repository")
         )
+    
+    def _build_mcp_protocol(self) -> Any:
+        from src.mcp.protocol import FlipflopsProtocol
         
-        # Route component
-        self.mcp_route = FlipflopsRoute(
-            model=self.mcp_model,
-            context=self.mcp_context,
-            protocol=self.mcp_protocol
+        return FlipflopsProtocol(
+            model=self.get("mcp_model"),
+            context=self.get("mcp_context")
         )
+    
+    def _build_mcp_route(self) -> Any:
+        from src.mcp.route import FlipflopsRoute
         
+        route = FlipflopsRoute(
+            model=self.get("mcp_model"),
+            context=self.get("mcp_context"),
+            protocol=self.get("mcp_protocol")
+        )
         logger.info("MCP components initialized")
+        return route
     
-    def _init_controllers(self) -> None:
-        """Initialize all controllers."""
+    # Controllers and UI
+    
+    def _build_main_controller(self) -> Any:
+        from src.http.controllers.main_controller import MainController
+        
         # Now using MCP route component
-        self.main_controller = MainController(
-            route=self.mcp_route
+        controller = MainController(
+            route=self.get("mcp_route")
         )
-        
         logger.info("Controllers initialized with MCP pattern")
+        return controller
     
-    def _init_ui(self) -> None:
-        """Initialize the UI components."""
-        self.cli_interface = CommandLineInterface(
-            controller=self.main_controller
+    def _build_cli_interface(self) -> "CommandLineInterface":
+        from src.infrastructure.ui.command_line_interface import CommandLineInterface
+        
+        return CommandLineInterface(
+            controller=self.get("main_controller")
         )
     
-    def get_cli_interface(self) -> CommandLineInterface:
+    def get_cli_interface(self) -> "CommandLineInterface":
         """
         Get the CLI interface.
         
         Returns:
-            The initialized CLI interface
+            The CLI interface, built together with its dependencies on first call
         """
-        return self.cli_interface
+        return self.get("cli_interface")
 
 
+@lru_cache(maxsize=2)
 def initialize_container(config_file: str, data_dir: str) -> DependencyContainer:
     """
     Initialize the dependency container.
     
+    Containers are cached per (config_file, data_dir), so repeated calls
+    share the same instance and its already-built components. Use
+    initialize_container.cache_clear() to force a fresh container.
+    
     Args:
         config_file: Path to the configuration file
         data_dir: Path to the data directory
@@ -2,11 +2,26 @@
 Configuração de logging para a aplicação.
 """
 import os
+import queue
+import atexit
 import logging
 import logging.handlers
 from typing import Optional
 
 
+# Accepted log level names, shared with the command-line parser
+LOG_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+# Third-party loggers capped at WARNING
+_QUIET_LOGGERS = ("httpx", "urllib3", "matplotlib")
+
+# Listener that drains the log queue into the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def configure_logging(level_name: str = "INFO", log_file: Optional[str] = None) -> None:
     """
     Configure the logging for the application.
@@ -16,7 +31,9 @@ def configure_logging(level_name: str = "INFO", log_file: Optional[str] = None)
         log_file: Path to the log file (optional)
     """
     # Convert level name to logging level
-    level = getattr(logging, level_name)
+    level = LOG_LEVELS.get(level_name.upper())
+    if level is None:
+        raise ValueError(f"Invalid log level: {level_name}")
     
     # Basic configuration
     handlers = []
@@ -34,10 +51,11 @@ def configure_logging(level_name: str = "INFO", log_file: Optional[str] = None)
     if log_file:
         # Create directory if it doesn't exist
         log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
+        if log_dir:
             os.makedirs(log_dir, exist_ok=True)
             
-        # Create file handler
+        # Create file handler; it runs on the listener thread, so rotation
+        # never blocks the code that logs
         file_handler = logging.handlers.RotatingFileHandler(
             log_file, 
             maxBytes=10 * 1024 * 1024,  # 10 MB
@@ -50,20 +68,48 @@ def configure_logging(level_name: str = "INFO", log_file: Optional[str] = None)
         file_handler.setFormatter(file_formatter)
         handlers.append(file_handler)
     
-    # Configure the root logger
-    logging.basicConfig(
-        level=level,
-        handlers=handlers,
-        force=True
+    # Run the real handlers on a background thread so that logging calls
+    # only enqueue the record and never wait on file writes or rotation
+    global _queue_listener
+    if _queue_listener is not None:
+        _stop_queue_listener()
+    else:
+        atexit.register(_stop_queue_listener)
+    
+    log_queue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
     )
+    _queue_listener.start()
     
-    # Set specific logger levels
-    # For example, to reduce verbosity of third-party libraries:
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("matplotlib").setLevel(logging.WARNING)
+    # Formatting is left to the handlers behind the listener
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    # Configure the root logger, replacing any previous handlers
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(queue_handler)
+    
+    # Reduce verbosity of third-party libraries
+    for name in _QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
     
     # Log the configuration
     logger = logging.getLogger(__name__)
     logger.info(f"Logging configurado com nível {level_name}")
     if log_file:
         logger.info(f"Logs sendo salvos em {log_file}") 
+
+
+def _stop_queue_listener() -> None:
+    """Flush pending log records, stop the queue listener and close its handlers."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
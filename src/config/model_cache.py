@@ -0,0 +1,46 @@
+"""
+Location and offline handling of the embedding model.
+
+Shared by both dependency containers, which build the embedding service
+the same way.
+"""
+import os
+
+
+# Sentence-transformers model used for document embeddings
+EMBEDDING_MODEL_NAME = "sentence-transformers/distiluse-base-multilingual-cased-v1"
+
+
+def prefer_local_model_cache(model_name: str) -> None:
+    """
+    Switch the Hugging Face libraries to offline mode if the model is cached.
+    
+    Without this every start probes the Hub over HTTP even when the model
+    is already on disk. The first run still needs network access to
+    download it. Explicit HF_HUB_OFFLINE/TRANSFORMERS_OFFLINE values in the
+    environment are left untouched.
+    
+    Args:
+        model_name: Hub id of the model, e.g. "sentence-transformers/..."
+    """
+    hub_cache = os.environ.get("HF_HUB_CACHE") or os.path.join(
+        os.environ.get("HF_HOME", os.path.join("~", ".cache", "huggingface")), "hub"
+    )
+    model_dir = os.path.join(
+        os.path.expanduser(hub_cache), "models--" + model_name.replace("/", "--")
+    )
+    
+    if os.path.isdir(model_dir):
+        os.environ.setdefault("HF_HUB_OFFLINE", "1")
+        os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+
+
+def model_snapshot_dir() -> str:
+    """
+    Directory for the embedding model snapshot, in the user's cache.
+    
+    The snapshot is a full copy of the model, hundreds of MB, so it is kept
+    out of the project's data directory.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return os.path.join(os.path.expanduser(cache_home), "flipflops", "models")
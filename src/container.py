@@ -6,42 +6,36 @@ da aplicação, seguindo os princípios de inversão de dependência da Clean Ar
 """
 import os
 import logging
+import threading
 import configparser
-from typing import Dict, Any, Optional
+from concurrent.futures import Future
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 
-# MCP components
-from src.mcp.model import FlipflopsModel
-from src.mcp.context import FlipflopsContext
-from src.mcp.protocol import FlipflopsProtocol
-from src.mcp.route import FlipflopsRoute
-
-# Controllers
-from src.http.controllers.main_controller import MainController
-
-# UI
-from src.infrastructure.ui.command_line_interface import CommandLineInterface
-
-# Use cases
-from src.usecases.question_answering_usecase import QuestionAnsweringUseCase
-from src.usecases.exam_generation_usecase import ExamGenerationUseCase
-from src.usecases.conversation_management_usecase import ConversationManagementUseCase
-from src.usecases.response_generation_usecase import ResponseGenerationUseCase
-from src.usecases.query_processing_usecase import QueryProcessingUseCase
-
-# Services
-from src.infrastructure.services.claude_llm_service import ClaudeLLMService
-from src.infrastructure.services.claude_query_service import ClaudeQueryService
-from src.infrastructure.services.faiss_embedding_service import FAISSEmbeddingService
-
-# Repositories
-from src.infrastructure.repositories.pdf_document_repository import PDFDocumentRepository
-from src.infrastructure.repositories.faiss_embedding_repository import FAISSEmbeddingRepository
-from src.infrastructure.repositories.file_conversation_repository import FileConversationRepository
-from src.infrastructure.repositories.file_topic_repository import FileTopicRepository
+if TYPE_CHECKING:
+    from src.infrastructure.ui.command_line_interface import CommandLineInterface
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Configuração padrão que não depende do diretório de dados
+_DEFAULT_CONFIG = MappingProxyType({
+    'api_key': '',
+    'api_url': 'https://api.anthropic.com/v1/messages',
+    'api_model': 'claude-3-sonnet-20240229',
+    'max_tokens': 4096,
+    'temperature': 0.7,
+})
+
+# Variáveis de ambiente que sobrescrevem o arquivo de configuração:
+# (chave da configuração, variável de ambiente, conversão)
+_ENV_OVERRIDES = (
+    ('api_key', 'CLAUDE_API_KEY', str),
+    ('api_model', 'MODEL_NAME', str),
+    ('max_tokens', 'MAX_TOKENS', int),
+)
+
 
 class Container:
     """
@@ -50,12 +44,32 @@ class Container:
     Responsável por inicializar, configurar e fornecer acesso a todos os
     componentes da aplicação. Centraliza a criação de objetos e 
     gerencia suas dependências.
+    
+    Os componentes são criados sob demanda no primeiro acesso e reutilizados
+    depois, de modo que cada comando só paga o custo de importação e
+    inicialização do que realmente usa (ex.: o modelo de embeddings).
+    
+    A exceção são os componentes de PREWARM_COMPONENTS, que não dependem
+    uns dos outros e começam a ser criados em segundo plano já na construção
+    (se prewarm for True). Assim o carregamento do modelo de embeddings e a
+    leitura dos repositórios em disco acontecem ao mesmo tempo, e a
+    inicialização leva o tempo do mais lento em vez da soma de todos.
     """
     
+    # Componentes independentes criados em paralelo na construção
+    PREWARM_COMPONENTS = (
+        'embedding_service',
+        'embedding_repository',
+        'document_repository',
+        'conversation_repository',
+        'topic_repository',
+    )
+    
     def __init__(
         self, 
         config_path: Optional[str] = None, 
-        data_dir: Optional[str] = None
+        data_dir: Optional[str] = None,
+        prewarm: bool = True
     ):
         """
         Inicializa o contêiner com as configurações fornecidas.
@@ -63,6 +77,7 @@ class Container:
         Args:
             config_path: Caminho para o arquivo de configuração
             data_dir: Diretório para armazenamento de dados
+            prewarm: Criar os componentes de PREWARM_COMPONENTS em segundo plano
         """
         # Inicializar valores de configuração
         self.config_path = config_path or os.getenv('CONFIG_PATH', 'config.ini')
@@ -74,13 +89,18 @@ class Container:
         # Criar diretórios de dados
         self._create_data_dirs()
         
-        # Inicializar componentes
-        self._init_repositories()
-        self._init_services()
-        self._init_usecases()
-        self._init_mcp_components()
-        self._init_controllers()
-        self._init_ui()
+        # Verificar API key
+        if not self.config.get('api_key'):
+            logger.warning(
+                "Chave API não configurada. Os serviços LLM não funcionarão corretamente."
+            )
+        
+        # Pré-carregar os componentes independentes; configuração e
+        # diretórios já estão prontos, e nada mais é alterado nas threads
+        self._warmups: Dict[str, Future] = {}
+        if prewarm:
+            for name in self.PREWARM_COMPONENTS:
+                self._start_warmup(name, getattr(self, f'_build_{name}'))
         
         logger.info("Contêiner de dependências inicializado com sucesso")
     
@@ -88,59 +108,22 @@ class Container:
         """
         Carrega a configuração do arquivo config.ini ou cria uma configuração padrão.
         
+        O resultado é memoizado por caminho, data de modificação do arquivo,
+        diretório de dados e variáveis de ambiente relevantes, então criar
+        vários contêineres não relê o arquivo enquanto ele não mudar.
+        
         Returns:
             Dicionário com configurações
         """
-        config = {}
-        
-        # Verificar se o arquivo de configuração existe
-        if os.path.exists(self.config_path):
-            logger.info(f"Carregando configurações de {self.config_path}")
-            parser = configparser.ConfigParser()
-            parser.read(self.config_path)
-            
-            # Configurações da API
-            if 'API' in parser:
-                config['api_key'] = parser.get('API', 'api_key', fallback='')
-                config['api_url'] = parser.get(
-                    'API', 'api_url', 
-                    fallback='https://api.anthropic.com/v1/messages'
-                )
-                config['api_model'] = parser.get(
-                    'API', 'api_model', 
-                    fallback='claude-3-sonnet-20240229'
-                )
-            
-            # Configurações da aplicação
-            if 'APP' in parser:
-                config['max_tokens'] = parser.getint('APP', 'max_tokens', fallback=4096)
-                config['temperature'] = parser.getfloat('APP', 'temperature', fallback=0.7)
-            
-            # Configurações de dados
-            if 'DATA' in parser:
-                config['context_file'] = parser.get(
-                    'DATA', 'context_file', 
-                    fallback=os.path.join(self.data_dir, 'FLIPFLOP.md')
-                )
-                config['documents_dir'] = parser.get(
-                    'DATA', 'documents_dir',
-                    fallback=os.path.join(self.data_dir, 'documents')
-                )
-        else:
-            logger.warning(f"Arquivo de configuração {self.config_path} não encontrado")
-            config = self._create_default_config()
-            
-        # Sobrescrever configurações com variáveis de ambiente
-        config['api_key'] = os.getenv('CLAUDE_API_KEY', config.get('api_key', ''))
-        config['api_model'] = os.getenv(
-            'MODEL_NAME', 
-            config.get('api_model', 'claude-3-sonnet-20240229')
-        )
-        config['max_tokens'] = int(
-            os.getenv('MAX_TOKENS', config.get('max_tokens', 4096))
-        )
+        try:
+            mtime = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        environ = os.environ
+        env = tuple(environ.get(name) for _, name, _ in _ENV_OVERRIDES)
         
-        return config
+        # Cópia, para que alterações feitas por quem chamou não vazem para o cache
+        return dict(_read_config(self.config_path, mtime, self.data_dir, env))
     
     def _create_default_config(self) -> Dict[str, Any]:
         """
@@ -149,16 +132,7 @@ class Container:
         Returns:
             Dicionário com configurações padrão
         """
-        logger.info("Criando configuração padrão")
-        return {
-            'api_key': '',
-            'api_url': 'https://api.anthropic.com/v1/messages',
-            'api_model': 'claude-3-sonnet-20240229',
-            'max_tokens': 4096,
-            'temperature': 0.7,
-            'context_file': os.path.join(self.data_dir, 'FLIPFLOP.md'),
-            'documents_dir': os.path.join(self.data_dir, 'documents'),
-        }
+        return _default_config(self.data_dir)
     
     def _create_data_dirs(self) -> None:
         """Cria os diretórios necessários para os dados da aplicação."""
@@ -168,107 +142,192 @@ class Container:
         self.conversations_dir = os.path.join(self.data_dir, 'conversations')
         self.topics_dir = os.path.join(self.data_dir, 'topics')
         
-        # Criar diretórios se não existirem
+        # Criar diretórios se não existirem; os subdiretórios já criam
+        # data_dir, e exist_ok evita uma checagem de existência por diretório
         for directory in [
-            self.data_dir,
             self.documents_dir, 
             self.embeddings_dir,
             self.conversations_dir,
             self.topics_dir
         ]:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
-                logger.info(f"Diretório criado: {directory}")
+            os.makedirs(directory, exist_ok=True)
+        logger.debug(f"Diretórios de dados prontos em {self.data_dir}")
     
-    def _init_repositories(self) -> None:
-        """Inicializa os repositórios da aplicação."""
-        logger.info("Inicializando repositórios")
+    def _start_warmup(self, name: str, builder) -> None:
+        """
+        Cria um componente em uma thread de segundo plano.
+        
+        A thread é daemon, para que encerrar a aplicação durante a carga
+        não precise esperar o modelo terminar de carregar.
+        """
+        future: Future = Future()
+        
+        def run():
+            try:
+                future.set_result(builder())
+            except BaseException as e:
+                future.set_exception(e)
         
-        # Repositório de documentos
-        self.document_repository = PDFDocumentRepository(
+        self._warmups[name] = future
+        threading.Thread(target=run, name=f"{name}-warmup", daemon=True).start()
+    
+    def _warmed(self, name: str, builder):
+        """
+        Obtém um componente pré-carregado, aguardando sua criação.
+        
+        Só é chamado pelas cached_property, uma vez por componente. Se o
+        pré-carregamento falhou (ou não foi feito), o componente é criado
+        de novo aqui para que o erro apareça para quem o usa.
+        """
+        future = self._warmups.pop(name, None)
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as e:
+                logger.debug(f"Falha ao pré-carregar {name}: {e}")
+        return builder()
+    
+    # Repositórios
+    
+    @cached_property
+    def document_repository(self):
+        """Repositório de documentos."""
+        return self._warmed('document_repository', self._build_document_repository)
+    
+    def _build_document_repository(self):
+        """Cria o repositório de documentos."""
+        from src.infrastructure.repositories.pdf_document_repository import PDFDocumentRepository
+        return PDFDocumentRepository(
             storage_dir=self.documents_dir
         )
-        
-        # Repositório de embeddings
-        self.embedding_repository = FAISSEmbeddingRepository(
+    
+    @cached_property
+    def embedding_repository(self):
+        """Repositório de embeddings."""
+        return self._warmed('embedding_repository', self._build_embedding_repository)
+    
+    def _build_embedding_repository(self):
+        """Cria o repositório de embeddings."""
+        from src.infrastructure.repositories.faiss_embedding_repository import FAISSEmbeddingRepository
+        return FAISSEmbeddingRepository(
             storage_dir=self.embeddings_dir
         )
-        
-        # Repositório de conversas
-        self.conversation_repository = FileConversationRepository(
+    
+    @cached_property
+    def conversation_repository(self):
+        """Repositório de conversas."""
+        return self._warmed('conversation_repository', self._build_conversation_repository)
+    
+    def _build_conversation_repository(self):
+        """Cria o repositório de conversas."""
+        from src.infrastructure.repositories.file_conversation_repository import FileConversationRepository
+        return FileConversationRepository(
             storage_dir=self.conversations_dir,
             context_file_path=self.config['context_file']
         )
-        
-        # Repositório de tópicos
-        self.topic_repository = FileTopicRepository(
+    
+    @cached_property
+    def topic_repository(self):
+        """Repositório de tópicos."""
+        return self._warmed('topic_repository', self._build_topic_repository)
+    
+    def _build_topic_repository(self):
+        """Cria o repositório de tópicos."""
+        from src.infrastructure.repositories.file_topic_repository import FileTopicRepository
+        return FileTopicRepository(
             storage_dir=self.topics_dir
         )
     
-    def _init_services(self) -> None:
-        """Inicializa os serviços da aplicação."""
-        logger.info("Inicializando serviços")
-        
-        # Verificar API key
-        if not self.config.get('api_key'):
-            logger.warning(
-                "Chave API não configurada. Os serviços LLM não funcionarão corretamente."
-            )
-        
-        # Serviço LLM
-        self.llm_service = ClaudeLLMService(
+    # Serviços
+    
+    @cached_property
+    def llm_service(self):
+        """Serviço LLM."""
+        from src.infrastructure.services.claude_llm_service import ClaudeLLMService
+        return ClaudeLLMService(
             api_key=self.config.get('api_key', ''),
             api_url=self.config.get('api_url', ''),
             model=self.config.get('api_model', ''),
             max_tokens=self.config.get('max_tokens', 4096),
             temperature=self.config.get('temperature', 0.7)
         )
-        
-        # Serviço de consulta
-        self.query_service = ClaudeQueryService(
+    
+    @cached_property
+    def query_service(self):
+        """Serviço de consulta."""
+        from src.infrastructure.services.claude_query_service import ClaudeQueryService
+        return ClaudeQueryService(
             api_key=self.config.get('api_key', ''),
             api_url=self.config.get('api_url', ''),
             model=self.config.get('api_model', ''),
             max_tokens=self.config.get('max_tokens', 4096),
             temperature=self.config.get('temperature', 0.7)
         )
+    
+    @cached_property
+    def embedding_service(self):
+        """Serviço de embeddings (carrega o modelo sentence-transformers)."""
+        return self._warmed('embedding_service', self._build_embedding_service)
+    
+    def _build_embedding_service(self):
+        """Cria o serviço de embeddings."""
+        from src.config.model_cache import (
+            EMBEDDING_MODEL_NAME, model_snapshot_dir, prefer_local_model_cache
+        )
+        
+        # Precisa rodar antes de importar o sentence-transformers (e o huggingface_hub)
+        prefer_local_model_cache(EMBEDDING_MODEL_NAME)
         
-        # Serviço de embeddings
-        self.embedding_service = FAISSEmbeddingService(
-            model_name="sentence-transformers/distiluse-base-multilingual-cased-v1"
+        from src.infrastructure.services.faiss_embedding_service import FAISSEmbeddingService
+        return FAISSEmbeddingService(
+            model_name=EMBEDDING_MODEL_NAME,
+            snapshot_dir=model_snapshot_dir()
         )
     
-    def _init_usecases(self) -> None:
-        """Inicializa os casos de uso da aplicação."""
-        logger.info("Inicializando casos de uso")
-        
-        # Geração de respostas
-        self.response_generation_usecase = ResponseGenerationUseCase(
+    # Casos de uso
+    
+    @cached_property
+    def response_generation_usecase(self):
+        """Geração de respostas."""
+        from src.usecases.response_generation_usecase import ResponseGenerationUseCase
+        return ResponseGenerationUseCase(
             llm_service=self.llm_service
         )
-        
-        # Processamento de consultas
-        self.query_processing_usecase = QueryProcessingUseCase(
+    
+    @cached_property
+    def query_processing_usecase(self):
+        """Processamento de consultas."""
+        from src.usecases.query_processing_usecase import QueryProcessingUseCase
+        return QueryProcessingUseCase(
             query_service=self.query_service,
             embedding_service=self.embedding_service,
             document_repository=self.document_repository,
             embedding_repository=self.embedding_repository
         )
-        
-        # Gerenciamento de conversas
-        self.conversation_management_usecase = ConversationManagementUseCase(
+    
+    @cached_property
+    def conversation_management_usecase(self):
+        """Gerenciamento de conversas."""
+        from src.usecases.conversation_management_usecase import ConversationManagementUseCase
+        return ConversationManagementUseCase(
             conversation_repository=self.conversation_repository
         )
-        
-        # Resposta a perguntas
-        self.question_answering_usecase = QuestionAnsweringUseCase(
+    
+    @cached_property
+    def question_answering_usecase(self):
+        """Resposta a perguntas."""
+        from src.usecases.question_answering_usecase import QuestionAnsweringUseCase
+        return QuestionAnsweringUseCase(
             query_processing=self.query_processing_usecase,
             response_generation=self.response_generation_usecase,
             conversation_management=self.conversation_management_usecase
         )
-        
-        # Geração de exames
-        self.exam_generation_usecase = ExamGenerationUseCase(
+    
+    @cached_property
+    def exam_generation_usecase(self):
+        """Geração de exames."""
+        from src.usecases.exam_generation_usecase import ExamGenerationUseCase
+        return ExamGenerationUseCase(
             llm_service=self.llm_service,
             query_service=self.query_service,
             embedding_service=self.embedding_service,
@@ -276,54 +335,64 @@ class Container:
             topic_repository=self.topic_repository
         )
     
-    def _init_mcp_components(self) -> None:
-        """Inicializa os componentes do padrão MCP."""
-        logger.info("Inicializando componentes MCP")
-        
-        # Modelo
-        self.model = FlipflopsModel(
+    # Componentes MCP
+    
+    @cached_property
+    def model(self):
+        """Modelo MCP."""
+        from src.mcp.model import FlipflopsModel
+        return FlipflopsModel(
             question_answering_usecase=self.question_answering_usecase,
             exam_generation_usecase=self.exam_generation_usecase,
             conversation_management_usecase=self.conversation_management_usecase
         )
-        
-        # Contexto
-        self.context = FlipflopsContext(
+    
+    @cached_property
+    def context(self):
+        """Contexto MCP."""
+        from src.mcp.context import FlipflopsContext
+        return FlipflopsContext(
             conversation_repository=self.conversation_repository
         )
-        
-        # Protocolo
-        self.protocol = FlipflopsProtocol(
+    
+    @cached_property
+    def protocol(self):
+        """Protocolo MCP."""
+        from src.mcp.protocol import FlipflopsProtocol
+        return FlipflopsProtocol(
             model=self.model,
             context=self.context
         )
-        
-        # Rota
-        self.route = FlipflopsRoute(
+    
+    @cached_property
+    def route(self):
+        """Rota MCP."""
+        from src.mcp.route import FlipflopsRoute
+        return FlipflopsRoute(
             model=self.model,
             context=self.context,
             protocol=self.protocol
         )
     
-    def _init_controllers(self) -> None:
-        """Inicializa os controladores da aplicação."""
-        logger.info("Inicializando controladores")
-        
-        # Controlador principal
-        self.main_controller = MainController(
+    # Controladores e interfaces
+    
+    @cached_property
+    def main_controller(self):
+        """Controlador principal."""
+        from src.http.controllers.main_controller import MainController
+        return MainController(
             route=self.route
         )
     
-    def _init_ui(self) -> None:
-        """Inicializa as interfaces de usuário."""
-        logger.info("Inicializando interfaces de usuário")
-        
-        # Interface de linha de comando
-        self.cli = CommandLineInterface(
+    @cached_property
+    def cli(self) -> "CommandLineInterface":
+        """Interface de linha de comando."""
+        from src.infrastructure.ui.command_line_interface import CommandLineInterface
+        return CommandLineInterface(
             controller=self.main_controller
         )
     
-    def get_cli(self) -> CommandLineInterface:
+    def get_cli(self) -> "CommandLineInterface":
         """
         Obtém a interface de linha de comando.
         
@@ -331,3 +400,90 @@ class Container:
             Interface de linha de comando configurada
         """
         return self.cli 
+
+
+def _default_config(data_dir: str) -> Dict[str, Any]:
+    """
+    Cria uma configuração padrão quando o arquivo config.ini não existe.
+    
+    Args:
+        data_dir: Diretório para armazenamento de dados
+        
+    Returns:
+        Dicionário com configurações padrão
+    """
+    logger.info("Criando configuração padrão")
+    config = dict(_DEFAULT_CONFIG)
+    config['context_file'] = os.path.join(data_dir, 'FLIPFLOP.md')
+    config['documents_dir'] = os.path.join(data_dir, 'documents')
+    return config
+
+
+@lru_cache(maxsize=8)
+def _read_config(
+    config_path: str,
+    mtime: Optional[int],
+    data_dir: str,
+    env: Tuple[Optional[str], ...]
+) -> Dict[str, Any]:
+    """
+    Lê e resolve a configuração; memoizado pelos argumentos.
+    
+    Args:
+        config_path: Caminho para o arquivo de configuração
+        mtime: st_mtime_ns do arquivo, ou None se ele não existir
+        data_dir: Diretório para armazenamento de dados
+        env: Valores atuais de _ENV_OVERRIDES
+        
+    Returns:
+        Dicionário com configurações (não deve ser alterado)
+    """
+    config = {}
+    
+    # Verificar se o arquivo de configuração existe
+    if mtime is not None:
+        logger.info(f"Carregando configurações de {config_path}")
+        parser = configparser.ConfigParser()
+        parser.read(config_path)
+        
+        # Configurações da API
+        if 'API' in parser:
+            config['api_key'] = parser.get('API', 'api_key', fallback='')
+            config['api_url'] = parser.get(
+                'API', 'api_url', 
+                fallback=_DEFAULT_CONFIG['api_url']
+            )
+            config['api_model'] = parser.get(
+                'API', 'api_model', 
+                fallback=_DEFAULT_CONFIG['api_model']
+            )
+        
+        # Configurações da aplicação
+        if 'APP' in parser:
+            config['max_tokens'] = parser.getint('APP', 'max_tokens', fallback=4096)
+            config['temperature'] = parser.getfloat('APP', 'temperature', fallback=0.7)
+        
+        # Configurações de dados; os caminhos padrão só são montados se faltarem
+        if 'DATA' in parser:
+            data = parser['DATA']
+            context_file = data.get('context_file')
+            documents_dir = data.get('documents_dir')
+            config['context_file'] = (
+                context_file if context_file is not None
+                else os.path.join(data_dir, 'FLIPFLOP.md')
+            )
+            config['documents_dir'] = (
+                documents_dir if documents_dir is not None
+                else os.path.join(data_dir, 'documents')
+            )
+    else:
+        logger.warning(f"Arquivo de configuração {config_path} não encontrado")
+        config = _default_config(data_dir)
+    
+    # Sobrescrever configurações com variáveis de ambiente
+    for (key, _, cast), value in zip(_ENV_OVERRIDES, env):
+        if value is None:
+            value = config.get(key, _DEFAULT_CONFIG[key])
+        config[key] = cast(value)
+    
+    return config
\ No newline at end of file
@@ -1,10 +1,11 @@
 """
 Context management for the Model-Context-Protocol pattern.
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 import uuid
 import logging
 from datetime import datetime
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -61,9 +62,21 @@ class Context:
         
         self.data['history'].append(entry)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert context to dictionary."""
-        return self.data.copy()
+    def to_dict(self, copy: bool = True) -> Mapping[str, Any]:
+        """
+        Convert context to dictionary.
+        
+        Args:
+            copy: Return a shallow copy the caller may modify; if False,
+                return a read-only view of the live data, which avoids the
+                copy for callers that only read
+            
+        Returns:
+            Copy or read-only view of the context data
+        """
+        if copy:
+            return self.data.copy()
+        return MappingProxyType(self.data)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Context':
@@ -1,12 +1,16 @@
 """
 Entity representing a conversation with history and context.
 """
+from bisect import insort
+from copy import deepcopy
 from dataclasses import dataclass, field
+from io import StringIO
+from itertools import islice
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A message within a conversation."""
     id: str
@@ -14,11 +18,64 @@ class Message:
     role: str  # 'user', 'assistant', or 'system'
     timestamp: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    # (timestamp, formatted timestamp), rebuilt when timestamp changes
+    _time_str: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def time_str(self) -> str:
+        """Get the timestamp formatted for display."""
+        cache = self._time_str
+        if cache is None or cache[0] != self.timestamp:
+            cache = (self.timestamp, self.timestamp.strftime("%Y-%m-%d %H:%M:%S"))
+            self._time_str = cache
+        return cache[1]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the message to a dictionary.
+        
+        Returns:
+            Dictionary representation of the message
+        """
+        return {
+            "id": self.id,
+            "content": self.content,
+            "role": self.role,
+            "timestamp": self.timestamp.isoformat(),
+            "metadata": deepcopy(self.metadata)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Message':
+        """
+        Create a Message from a dictionary.
+        
+        Args:
+            data: Dictionary containing message data
+            
+        Returns:
+            A new Message instance
+        """
+        return cls(
+            id=data["id"],
+            content=data["content"],
+            role=data["role"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            metadata=deepcopy(data.get("metadata", {}))
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
-    """Represents a conversation with history and context."""
+    """
+    Represents a conversation with history and context.
+    
+    ``messages`` is kept in chronological order (oldest first), so readers
+    can slice it instead of sorting.
+    """
     
     id: str
     title: Optional[str] = None
@@ -28,14 +85,36 @@ class Conversation:
     updated_at: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # Rendered context text for the first _rendered_count messages of the
+    # list object _rendered_list, extended as messages are appended
+    _rendered_buf: StringIO = field(
+        default_factory=StringIO, init=False, repr=False, compare=False
+    )
+    _rendered_count: int = field(default=0, init=False, repr=False, compare=False)
+    _rendered_list: Optional[List[Message]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # API message dicts for the first len(_api_messages) messages of
+    # _rendered_list, extended the same way
+    _api_messages: List[Dict[str, str]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    
     def add_message(self, message: Message) -> None:
         """
         Add a message to the conversation.
         
+        Messages normally arrive in order and are appended; an older
+        message is inserted at its chronological position.
+        
         Args:
             message: The message to add
         """
-        self.messages.append(message)
+        if self.messages and message.timestamp < self.messages[-1].timestamp:
+            insort(self.messages, message, key=lambda m: m.timestamp)
+            self._reset_rendered()
+        else:
+            self.messages.append(message)
         self.updated_at = datetime.now()
     
     def get_messages(self, limit: Optional[int] = None, role: Optional[str] = None) -> List[Message]:
@@ -49,24 +128,23 @@ class Conversation:
         Returns:
             List of messages
         """
-        filtered = self.messages
+        # Messages are stored oldest first, so walking backwards yields newest first
+        newest_first = reversed(self.messages)
         
         # Filter by role if specified
         if role:
-            filtered = [m for m in filtered if m.role == role]
-            
-        # Sort by timestamp (newest first)
-        sorted_messages = sorted(filtered, key=lambda m: m.timestamp, reverse=True)
+            newest_first = (m for m in newest_first if m.role == role)
         
         # Apply limit if specified
         if limit and limit > 0:
-            return sorted_messages[:limit]
+            return list(islice(newest_first, limit))
             
-        return sorted_messages
+        return list(newest_first)
     
     def clear_messages(self) -> None:
         """Clear all messages from the conversation."""
         self.messages = []
+        self._reset_rendered()
         self.updated_at = datetime.now()
     
     def is_stale(self, retention_minutes: int = 10) -> bool:
@@ -82,49 +160,129 @@ class Conversation:
         if not self.messages:
             return True
             
-        # Find the most recent message timestamp
+        # The most recent message is the last one
         now = datetime.now()
-        latest_message = max(self.messages, key=lambda m: m.timestamp)
+        latest_message = self.messages[-1]
         
         # Check if the latest message is older than the retention period
         delta = now - latest_message.timestamp
         return delta.total_seconds() > (retention_minutes * 60)
     
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the conversation to a dictionary.
+        
+        The result shares no mutable state with the conversation.
+        
+        Returns:
+            Dictionary representation of the conversation
+        """
+        return {
+            "id": self.id,
+            "title": self.title,
+            "topic": self.topic,
+            "messages": [msg.to_dict() for msg in self.messages],
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "metadata": deepcopy(self.metadata)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Conversation':
+        """
+        Create a Conversation from a dictionary.
+        
+        The new conversation shares no mutable state with data, so the
+        same dictionary can be loaded more than once.
+        
+        Args:
+            data: Dictionary containing conversation data
+            
+        Returns:
+            A new Conversation instance
+        """
+        return cls(
+            id=data["id"],
+            title=data.get("title"),
+            topic=data.get("topic"),
+            messages=[Message.from_dict(msg) for msg in data.get("messages", [])],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            metadata=deepcopy(data.get("metadata", {}))
+        )
+    
+    def _reset_rendered(self) -> None:
+        """Discard the cached context text."""
+        self._rendered_buf = StringIO()
+        self._rendered_count = 0
+        self._rendered_list = self.messages
+        self._api_messages = []
+    
+    def _check_rendered(self) -> None:
+        """Drop the cached renderings if the message list was replaced or shortened."""
+        if (self._rendered_list is not self.messages
+                or self._rendered_count > len(self.messages)
+                or len(self._api_messages) > len(self.messages)):
+            self._reset_rendered()
+    
+    def to_api_messages(self) -> List[Dict[str, str]]:
+        """
+        Convert the messages to role/content dicts for an LLM API.
+        
+        Dicts for messages converted by a previous call are reused, so only
+        messages added since then are converted. The returned list is new
+        and may be extended by the caller.
+        
+        Returns:
+            One {"role", "content"} dict per message, oldest first
+        """
+        self._check_rendered()
+        
+        api_messages = self._api_messages
+        for msg in self.messages[len(api_messages):]:
+            api_messages.append({"role": msg.role, "content": msg.content})
+        return list(api_messages)
+    
+    @staticmethod
+    def _format_message(msg: Message) -> str:
+        """Format a single message for the context text."""
+        time_str = msg.time_str
+        
+        # Format based on role
+        if msg.role == "user":
+            return f"**User** ({time_str}):\n```\n{msg.content}\n```\n"
+        elif msg.role == "assistant":
+            return f"**Assistant** ({time_str}):\n```\n{msg.content}\n```\n"
+        elif msg.role == "system":
+            return f"**System Note** ({time_str}):\n_{msg.content}_\n"
+        return ""
+    
     def to_context_format(self) -> str:
         """
         Convert conversation to a format suitable for context.
         
+        Messages already rendered by a previous call are reused, so only
+        messages added since then are formatted.
+        
         Returns:
             Formatted string representation of the conversation
         """
-        lines = []
+        # The list was replaced or shortened behind our back
+        self._check_rendered()
         
-        if self.title:
-            lines.append(f"# {self.title}")
-            lines.append("")
-            
-        for msg in sorted(self.messages, key=lambda m: m.timestamp):
-            # Format timestamp
-            time_str = msg.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Format based on role
-            if msg.role == "user":
-                lines.append(f"**User** ({time_str}):")
-                lines.append(f"```")
-                lines.append(msg.content)
-                lines.append(f"```")
-            elif msg.role == "assistant":
-                lines.append(f"**Assistant** ({time_str}):")
-                lines.append(f"```")
-                lines.append(msg.content)
-                lines.append(f"```")
-            elif msg.role == "system":
-                lines.append(f"**System Note** ({time_str}):")
-                lines.append(f"_{msg.content}_")
-            
-            lines.append("")
-            
-        return "\n".join(lines)
+        buf = self._rendered_buf
+        for msg in self.messages[self._rendered_count:]:
+            if self._rendered_count:
+                buf.write("\n")
+            buf.write(self._format_message(msg))
+            self._rendered_count += 1
+        
+        body = buf.getvalue()
+        if not self.title:
+            return body
+        if not self.messages:
+            return f"# {self.title}\n"
+        return f"# {self.title}\n\n{body}"
         
     @staticmethod
     def from_context_file(context_str: str, conversation_id: str) -> 'Conversation':
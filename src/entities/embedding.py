@@ -1,25 +1,87 @@
 """
 Entity representing a vector embedding of text.
 """
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from dataclasses import MISSING, dataclass, field, fields
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Embedding:
-    """Represents a vector embedding of text content."""
+    """
+    Represents a vector embedding of text content.
+    
+    The vector is stored as a contiguous 1-D float32 array; lists passed to
+    the constructor are converted.
+    """
     
     id: str
-    vector: List[float]
+    vector: np.ndarray
     text: str
     document_id: Optional[str] = None
     chunk_id: Optional[str] = None
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    # (source vector, float32 array, L2 norm), rebuilt when vector is replaced
+    _vector_cache: Optional[Tuple[Any, np.ndarray, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (source vector, int8 array, scale), rebuilt when vector is replaced
+    _quantized_cache: Optional[Tuple[Any, np.ndarray, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
-        """Initialize default values."""
-        if self.metadata is None:
-            self.metadata = {}
+        """Convert the vector to float32."""
+        self.vector = np.ascontiguousarray(self.vector, dtype=np.float32)
+        if self.vector.ndim != 1:
+            raise ValueError("Embedding vector must be one-dimensional")
+    
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare all fields, including the vector.
+        
+        The generated __eq__ would compare the vectors with ==, which gives
+        an array with no single truth value, so they go through
+        np.array_equal instead.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.id == other.id
+            and self.text == other.text
+            and self.document_id == other.document_id
+            and self.chunk_id == other.chunk_id
+            and self.metadata == other.metadata
+            and np.array_equal(self.vector, other.vector)
+        )
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the pickled state, leaving out the derived vector caches."""
+        return {
+            f.name: getattr(self, f.name) for f in fields(self) if f.init
+        }
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a pickled embedding.
+        
+        Accepts the field dict written before the class used slots too,
+        so existing FAISS repository pickles keep loading.
+        """
+        for f in fields(self):
+            if f.init:
+                if f.name in state:
+                    value = state[f.name]
+                elif f.default_factory is not MISSING:
+                    value = f.default_factory()
+                else:
+                    value = f.default
+                setattr(self, f.name, value)
+            else:
+                setattr(self, f.name, None)
+        self.__post_init__()
     
     @property
     def dimension(self) -> int:
@@ -33,30 +95,124 @@ class Embedding:
     
     def add_metadata(self, key: str, value: Any) -> None:
         """Add metadata to the embedding."""
-        if self.metadata is None:
-            self.metadata = {}
         self.metadata[key] = value
     
     def get_metadata(self, key: str, default: Any = None) -> Any:
         """Get metadata from the embedding."""
-        if self.metadata is None:
-            return default
         return self.metadata.get(key, default)
     
+    def _as_array(self) -> Tuple[np.ndarray, float]:
+        """Get the vector as a float32 array together with its L2 norm."""
+        cache = self._vector_cache
+        if cache is None or cache[0] is not self.vector:
+            # Normally a no-op; converts a list assigned after construction
+            array = np.asarray(self.vector, dtype=np.float32)
+            cache = (self.vector, array, float(np.linalg.norm(array)))
+            self._vector_cache = cache
+        return cache[1], cache[2]
+    
+    def quantize(self) -> Tuple[np.ndarray, float]:
+        """
+        Get the vector quantized to int8 together with its scale.
+        
+        Each component is mapped to round(v / max|v| * 127), so the original
+        vector is approximately ``quantized * scale``.
+        """
+        cache = self._quantized_cache
+        if cache is None or cache[0] is not self.vector:
+            array, _ = self._as_array()
+            peak = float(np.max(np.abs(array))) if array.size else 0.0
+            scale = peak / 127 if peak else 1.0
+            quantized = np.round(array / scale).astype(np.int8)
+            cache = (self.vector, quantized, scale)
+            self._quantized_cache = cache
+        return cache[1], cache[2]
+    
+    @staticmethod
+    def dequantize(quantized: np.ndarray, scale: float) -> np.ndarray:
+        """Restore an approximate float32 vector from its int8 quantization."""
+        return quantized.astype(np.float32) * scale
+    
+    def quantized_cosine_similarity(self, other: "Embedding") -> float:
+        """
+        Calculate cosine similarity with another embedding using int8 vectors.
+        
+        The dot product runs on int32-widened int8 components; the scales
+        cancel out in the cosine, so only the integer norms are needed.
+        """
+        if other.dimension != self.dimension:
+            raise ValueError("Vectors must have the same dimension")
+        
+        vector1 = self.quantize()[0].astype(np.int32)
+        vector2 = other.quantize()[0].astype(np.int32)
+        norm1 = float(np.sqrt(vector1 @ vector1))
+        norm2 = float(np.sqrt(vector2 @ vector2))
+        
+        if norm1 == 0 or norm2 == 0:
+            return 0.0
+        
+        return float(vector1 @ vector2) / (norm1 * norm2)
+    
     def cosine_similarity(self, other_vector: List[float]) -> float:
         """
         Calculate cosine similarity with another vector.
         
-        Note: This is a simple implementation and not optimized for performance.
+        The embedding's own array and norm are computed once and reused
+        across calls, so only the other vector's norm is computed each time.
         """
-        if len(other_vector) != self.dimension:
+        other = np.asarray(other_vector, dtype=np.float32)
+        if other.shape != (self.dimension,):
             raise ValueError("Vectors must have the same dimension")
-            
-        dot_product = sum(a * b for a, b in zip(self.vector, other_vector))
-        norm1 = sum(a * a for a in self.vector) ** 0.5
-        norm2 = sum(b * b for b in other_vector) ** 0.5
+        
+        vector, norm1 = self._as_array()
+        norm2 = float(np.linalg.norm(other))
         
         if norm1 == 0 or norm2 == 0:
-            return 0
+            return 0.0
             
-        return dot_product / (norm1 * norm2) 
+        return float(vector @ other) / (norm1 * norm2) 
+    
+    @classmethod
+    def batch_cosine_similarity(
+        cls, query_vector: List[float], embeddings: Sequence["Embedding"]
+    ) -> np.ndarray:
+        """
+        Calculate the cosine similarity between a query vector and many embeddings.
+        
+        The embeddings are stacked into a single row-normalized matrix so all
+        similarities come out of one matrix-vector product.
+        """
+        if not embeddings:
+            return np.empty(0, dtype=np.float32)
+        
+        query = np.asarray(query_vector, dtype=np.float32)
+        arrays = []
+        norms = np.empty(len(embeddings), dtype=np.float32)
+        for i, embedding in enumerate(embeddings):
+            if query.shape != (embedding.dimension,):
+                raise ValueError("Vectors must have the same dimension")
+            array, norms[i] = embedding._as_array()
+            arrays.append(array)
+        
+        query_norm = float(np.linalg.norm(query))
+        if query_norm == 0:
+            return np.zeros(len(embeddings), dtype=np.float32)
+        
+        # Zero vectors keep a similarity of 0.0 instead of dividing by zero
+        norms[norms == 0] = np.inf
+        matrix = np.stack(arrays) / norms[:, np.newaxis]
+        return matrix @ (query / query_norm)
+    
+    @classmethod
+    def most_similar(
+        cls, query_vector: List[float], embeddings: Sequence["Embedding"], top_k: int = 5
+    ) -> List[Tuple["Embedding", float]]:
+        """Get the top_k embeddings most similar to the query vector, best first."""
+        if top_k <= 0 or not embeddings:
+            return []
+        
+        similarities = cls.batch_cosine_similarity(query_vector, embeddings)
+        top_k = min(top_k, len(embeddings))
+        top = np.argpartition(similarities, -top_k)[-top_k:]
+        top = top[np.argsort(similarities[top])[::-1]]
+        return [(embeddings[i], float(similarities[i])) for i in top]
\ No newline at end of file
@@ -2,11 +2,11 @@
 File entity representing a study document.
 """
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class File:
     """A study document uploaded by the user."""
     id: str
@@ -17,28 +17,53 @@ class File:
     uploaded_at: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # (content, size) and (path, extension), rebuilt when the source changes
+    _size_cache: Optional[Tuple[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _extension_cache: Optional[Tuple[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        """Compute the size once on ingest."""
+        self._size_cache = (self.content, self._encoded_size(self.content))
+    
+    @staticmethod
+    def _encoded_size(content: str) -> int:
+        """Get the UTF-8 length of content without encoding ASCII text."""
+        if content.isascii():
+            return len(content)
+        return len(content.encode('utf-8'))
+    
     @property
     def size(self) -> int:
         """Get the size of the file content in bytes."""
-        return len(self.content.encode('utf-8'))
+        cache = self._size_cache
+        if cache is None or cache[0] is not self.content:
+            cache = (self.content, self._encoded_size(self.content))
+            self._size_cache = cache
+        return cache[1]
     
     @property
     def extension(self) -> str:
         """Get the file extension."""
-        return self.path.split('.')[-1] if '.' in self.path else ""
+        cache = self._extension_cache
+        if cache is None or cache[0] is not self.path:
+            extension = self.path.split('.')[-1] if '.' in self.path else ""
+            cache = (self.path, extension)
+            self._extension_cache = cache
+        return cache[1]
     
     def add_metadata(self, key: str, value: Any) -> None:
         """Add metadata to the file."""
-        if self.metadata is None:
-            self.metadata = {}
         self.metadata[key] = value
     
     def get_metadata(self, key: str, default: Any = None) -> Any:
         """Get metadata from the file."""
-        if self.metadata is None:
-            return default
         return self.metadata.get(key, default)
     
     def update_content(self, content: str) -> None:
         """Update the file content."""
         self.content = content
+        self._size_cache = (content, self._encoded_size(content))
@@ -1,22 +1,18 @@
 """
 Entity representing a search query.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Query:
     """Represents a search query."""
     
     id: str
     text: str
-    metadata: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        """Initialize default values."""
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    topic: Optional[str] = None
     
     @property
     def word_count(self) -> int:
@@ -30,14 +26,10 @@ class Query:
     
     def add_metadata(self, key: str, value: Any) -> None:
         """Add metadata to the query."""
-        if self.metadata is None:
-            self.metadata = {}
         self.metadata[key] = value
     
     def get_metadata(self, key: str, default: Any = None) -> Any:
         """Get metadata from the query."""
-        if self.metadata is None:
-            return default
         return self.metadata.get(key, default)
     
     def update_text(self, text: str) -> None:
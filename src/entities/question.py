@@ -13,6 +13,12 @@ class Question:
     the correct answer, an explanation, and the topic it belongs to.
     """
     
+    __slots__ = ('id', 'text', 'options', 'correct_answer', 'explanation', 'topic')
+    
+    # Option letters in order, and the same letters for validation
+    _OPTION_LETTERS = ('a', 'b', 'c', 'd', 'e')
+    _VALID_ANSWERS = frozenset(_OPTION_LETTERS)
+    
     def __init__(
         self,
         text: str,
@@ -41,9 +47,8 @@ class Question:
         self.topic = topic
         
         # Validate correct answer is in range
-        valid_answers = ['a', 'b', 'c', 'd', 'e']
-        if self.correct_answer not in valid_answers:
-            err = f"Correct answer must be one of {valid_answers}"
+        if self.correct_answer not in self._VALID_ANSWERS:
+            err = f"Correct answer must be one of {list(self._OPTION_LETTERS)}"
             err += f", got: {correct_answer}"
             raise ValueError(err)
         
@@ -120,13 +125,9 @@ class Question:
         Returns:
             Formatted question text with options
         """
-        option_letters = ['a', 'b', 'c', 'd', 'e']
-        options_text = "\n".join(
-            f"({letter}) {option}" 
-            for letter, option in zip(option_letters, self.options)
-        )
-        
-        return f"{self.text}\n\n{options_text}"
+        # __init__ guarantees exactly five options
+        a, b, c, d, e = self.options
+        return f"{self.text}\n\n(a) {a}\n(b) {b}\n(c) {c}\n(d) {d}\n(e) {e}"
     
     def __str__(self) -> str:
         """String representation of the question."""
@@ -2,7 +2,7 @@
 Topic entity representing a study subject for the FUVEST exam.
 """
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 
 @dataclass
@@ -17,6 +17,12 @@ class Topic:
     related_terms: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # (terms list, its length, set of its terms) for O(1) membership checks;
+    # rebuilt if related_terms is replaced or changed from outside
+    _related_terms_index: Optional[Tuple[List[str], int, Set[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     @property
     def has_description(self) -> bool:
         """Check if the topic has a description."""
@@ -27,10 +33,22 @@ class Topic:
         """Get the number of related terms."""
         return len(self.related_terms)
     
+    def _related_terms_set(self) -> Set[str]:
+        """Get the set of related terms, kept in sync with the list."""
+        index = self._related_terms_index
+        if (index is None or index[0] is not self.related_terms
+                or index[1] != len(self.related_terms)):
+            index = (self.related_terms, len(self.related_terms), set(self.related_terms))
+            self._related_terms_index = index
+        return index[2]
+    
     def add_related_term(self, term: str) -> None:
         """Add a related term to the topic."""
-        if term not in self.related_terms:
+        terms = self._related_terms_set()
+        if term not in terms:
+            terms.add(term)
             self.related_terms.append(term)
+            self._related_terms_index = (self.related_terms, len(self.related_terms), terms)
     
     def remove_related_term(self, term: str) -> bool:
         """
@@ -39,8 +57,15 @@ class Topic:
         Returns:
             bool: True if the term was removed, False if it wasn't found.
         """
-        if term in self.related_terms:
+        terms = self._related_terms_set()
+        if term in terms:
             self.related_terms.remove(term)
+            if len(self.related_terms) == len(terms) - 1:
+                terms.discard(term)
+                self._related_terms_index = (self.related_terms, len(self.related_terms), terms)
+            else:
+                # The list held duplicates, so the term may still be in it
+                self._related_terms_index = None
             return True
         return False
     
@@ -1,29 +1,77 @@
 """
 Anthropic Claude API implementation of LLM service.
 """
-from typing import Optional, List
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, List
+import hashlib
+import json
 import os
+import threading
 
 from anthropic import Anthropic
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.entities.conversation import Conversation
 from src.interfaces.llm import LLMService
+from src.infrastructure.external.claude_client import (
+    build_batch_prompt, length_sorted_order, split_batch_response
+)
+
+
+SYSTEM_PROMPT = (
+    "You are a helpful assistant for Brazilian high school students "
+    "preparing for the FUVEST exam. Answer the student's question "
+    "based on the provided context. If the answer cannot be "
+    "determined from the context, say so."
+)
 
 
 class ClaudeLLMService(LLMService):
-    """Implementation of LLM service using Anthropic Claude API."""
+    """
+    Implementation of LLM service using Anthropic Claude API.
+    
+    generate_answer can answer repeated requests from an LRU cache. Only
+    deterministic requests (temperature 0) are cached by default; at the
+    default temperature of 0.7 every call reaches the API unless the
+    service is created with cache_sampled=True.
+    """
+    
+    SYSTEM_PROMPT = SYSTEM_PROMPT
+    
+    # Questions packed into one request by generate_answers
+    MAX_BATCH_SIZE = 8
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-opus-20240229"):
+    # Answers kept by the response cache
+    CACHE_SIZE = 256
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "claude-3-opus-20240229",
+        cache_enabled: bool = True,
+        cache_sampled: bool = False
+    ):
         """
         Initialize the Claude LLM service.
         
         Args:
             api_key: Anthropic API key
             model: Claude model to use
+            cache_enabled: Reuse answers to identical requests
+            cache_sampled: Also cache requests with temperature > 0, whose
+                answers would otherwise vary between calls
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.model = model
         self.client = Anthropic(api_key=self.api_key)
+        self.cache_enabled = cache_enabled
+        self.cache_sampled = cache_sampled
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def generate_answer(
         self, 
@@ -33,35 +81,167 @@ class ClaudeLLMService(LLMService):
         max_tokens: int = 1000,
         temperature: float = 0.7
     ) -> str:
-        """Generate an answer using Claude API."""
-        system_prompt = (
-            "You are a helpful assistant for Brazilian high school students "
-            "preparing for the FUVEST exam. Answer the student's question "
-            "based on the provided context. If the answer cannot be "
-            "determined from the context, say so."
-        )
+        """
+        Generate an answer using Claude API.
         
-        messages = []
+        Identical requests are answered from an LRU cache when caching is
+        enabled and the request is deterministic or cache_sampled is set
+        (see __init__).
+        """
+        messages = self._build_messages(query, context, conversation)
         
-        # Add conversation history if available
-        if conversation and conversation.messages:
-            for msg in conversation.messages:
-                messages.append({"role": msg.role, "content": msg.content})
-        
-        # Add current query with context
-        prompt = f"Context:\n{context}\n\nQuestion: {query}"
-        messages.append({"role": "user", "content": prompt})
+        key = None
+        if self.cache_enabled and (temperature == 0 or self.cache_sampled):
+            key = self._cache_key(messages, max_tokens, temperature)
+            with self._cache_lock:
+                answer = self._cache.get(key)
+                if answer is not None:
+                    self._cache.move_to_end(key)
+                    return answer
         
         # Call Claude API
         response = self.client.messages.create(
             model=self.model,
-            system=system_prompt,
+            system=self.SYSTEM_PROMPT,
             messages=messages,
             max_tokens=max_tokens,
             temperature=temperature
         )
+        answer = response.content[0].text
+        
+        if key is not None:
+            with self._cache_lock:
+                self._cache[key] = answer
+                self._cache.move_to_end(key)
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        
+        return answer
+    
+    def clear_cache(self) -> None:
+        """Forget all cached answers."""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _cache_key(
+        self, messages: List[Dict[str, Any]], max_tokens: int, temperature: float
+    ) -> bytes:
+        """Digest of everything that determines the API request."""
+        request = {
+            "m": self.model,
+            "s": self.SYSTEM_PROMPT,
+            "msg": messages,
+            "n": max_tokens,
+            "t": temperature,
+        }
+        if orjson is not None:
+            data = orjson.dumps(request)
+        else:
+            data = json.dumps(request).encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).digest()
+    
+    def generate_answer_stream(
+        self, 
+        query: str, 
+        context: str, 
+        conversation: Optional[Conversation] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> Iterator[str]:
+        """
+        Generate an answer using Claude API, yielding text as it arrives.
+        
+        Same request as generate_answer, but streamed, so the first words
+        can be shown before the whole answer has been generated.
+        """
+        stream = self.client.messages.create(
+            model=self.model,
+            system=self.SYSTEM_PROMPT,
+            messages=self._build_messages(query, context, conversation),
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True
+        )
+        
+        for event in stream:
+            if event.type == "content_block_delta":
+                text = getattr(event.delta, "text", None)
+                if text:
+                    yield text
+    
+    def _build_messages(
+        self, query: str, context: str, conversation: Optional[Conversation]
+    ) -> List[Dict[str, Any]]:
+        """Build the message list: conversation history plus the new query."""
+        # Conversation history, converted incrementally by the conversation
+        messages = conversation.to_api_messages() if conversation else []
+        
+        # Add current query with context
+        prompt = f"Context:\n{context}\n\nQuestion: {query}"
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
+    def generate_answers(
+        self,
+        queries: List[str],
+        contexts: List[str],
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        max_batch_size: Optional[int] = None
+    ) -> List[str]:
+        """
+        Generate answers to several independent queries.
+        
+        Up to max_batch_size queries are packed into each request (batch
+        prompting), so N queries cost ceil(N / max_batch_size) API calls.
+        Queries are grouped by length before batching and the answers are
+        returned in input order. Answers missing from a batched response are
+        generated individually.
+        """
+        if len(contexts) != len(queries):
+            raise ValueError("contexts must have one entry per query")
+        
+        order = length_sorted_order(
+            [len(query) + len(context) for query, context in zip(queries, contexts)]
+        )
+        pairs = [(queries[i], contexts[i]) for i in order]
+        
+        batch_size = max(1, max_batch_size or self.MAX_BATCH_SIZE)
+        answers: List[str] = []
+        for start in range(0, len(pairs), batch_size):
+            batch = pairs[start:start + batch_size]
+            if len(batch) == 1:
+                answers.append(self.generate_answer(
+                    batch[0][0], batch[0][1],
+                    max_tokens=max_tokens, temperature=temperature
+                ))
+                continue
+            
+            prompt = build_batch_prompt(
+                [f"Context:\n{context}\n\nQuestion: {query}" for query, context in batch],
+                [None] * len(batch)
+            )
+            response = self.client.messages.create(
+                model=self.model,
+                system=self.SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens * len(batch),
+                temperature=temperature
+            )
+            
+            batch_answers = split_batch_response(response.content[0].text, len(batch))
+            for (query, context), answer in zip(batch, batch_answers):
+                if answer is None:
+                    answer = self.generate_answer(
+                        query, context, max_tokens=max_tokens, temperature=temperature
+                    )
+                answers.append(answer)
         
-        return response.content[0].text
+        # Restore the caller's order
+        results: List[str] = [""] * len(order)
+        for index, answer in zip(order, answers):
+            results[index] = answer
+        return results
     
     def generate_embeddings(self, text: str) -> List[float]:
         """
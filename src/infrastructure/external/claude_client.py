@@ -2,15 +2,137 @@
 Client for interacting with the Anthropic Claude API.
 """
 import os
+import re
 import json
+import time
+import random
 import logging
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterator, Optional, List, TypeVar
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Label that precedes each context passage in a prompt
+CONTEXT_PREFIX = "CONTEXT: "
+
+# Matches the "[n]" marker that starts each answer in a batched response
+_BATCH_MARKER = re.compile(r"^\[(\d+)\][ \t]*\n?", re.MULTILINE)
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Encode a request body as UTF-8 JSON, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data) -> Any:
+    """Decode a JSON response body (bytes or str)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def format_prompt(prompt: str, context: Optional[List[str]] = None) -> str:
+    """
+    Prepend context passages to a prompt.
+    
+    Args:
+        prompt: The user message
+        context: List of context passages to include in the prompt
+        
+    Returns:
+        The prompt, preceded by the formatted context if any
+    """
+    if not context:
+        return prompt
+    
+    # Collect every piece first so the prompt is copied only once, in the join
+    parts = []
+    for ctx in context:
+        parts.append(CONTEXT_PREFIX)
+        parts.append(ctx)
+        parts.append("\n\n")
+    parts.append(prompt)
+    return "".join(parts)
+
+
+def build_batch_prompt(
+    prompts: List[str], contexts: List[Optional[List[str]]]
+) -> str:
+    """
+    Pack several prompts into a single message (batch prompting).
+    
+    Each prompt is numbered from 1 and the model is asked to answer under
+    the same "[n]" markers, so split_batch_response can recover the answers.
+    
+    Args:
+        prompts: The user messages
+        contexts: Context passages for each prompt (None for no context)
+        
+    Returns:
+        The combined message
+    """
+    parts = [
+        f"Answer each of the {len(prompts)} numbered requests below "
+        "independently. Start each answer on a new line with the request's "
+        "number in square brackets, e.g. [1], and write nothing outside the "
+        "numbered answers."
+    ]
+    for index, (prompt, context) in enumerate(zip(prompts, contexts), start=1):
+        parts.append(f"[{index}]\n{format_prompt(prompt, context)}")
+    return "\n\n".join(parts)
+
+
+def length_sorted_order(lengths: List[int]) -> List[int]:
+    """
+    Get the indices of items ordered from shortest to longest.
+    
+    Batching items in this order keeps similar lengths together, so short
+    prompts don't wait behind long ones in the same request. Scatter the
+    results back with ``results[order[j]] = sorted_results[j]``.
+    
+    Args:
+        lengths: Length of each item
+        
+    Returns:
+        Item indices sorted by length (stable for equal lengths)
+    """
+    return sorted(range(len(lengths)), key=lengths.__getitem__)
+
+
+def split_batch_response(text: str, count: int) -> List[Optional[str]]:
+    """
+    Split a batched response into its numbered answers.
+    
+    Args:
+        text: The response to a prompt built by build_batch_prompt
+        count: Number of prompts in the batch
+        
+    Returns:
+        The answers in prompt order; None where the marker was missing
+    """
+    answers: List[Optional[str]] = [None] * count
+    matches = list(_BATCH_MARKER.finditer(text))
+    for i, match in enumerate(matches):
+        index = int(match.group(1)) - 1
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        if 0 <= index < count and answers[index] is None:
+            answers[index] = text[match.end():end].strip()
+    return answers
+
 
 class ClaudeClient:
     """Client for interacting with the Anthropic Claude API."""
@@ -24,6 +146,19 @@ class ClaudeClient:
     CLAUDE_3_HAIKU = "claude-3-haiku-20240307"
     CLAUDE_3_OPUS = "claude-3-opus-20240229"
     
+    # Prompts packed into one request by generate_responses_batch, and the
+    # output token ceiling a batched request is allowed to grow to
+    MAX_BATCH_SIZE = 8
+    MAX_OUTPUT_TOKENS = 4096
+    
+    # Concurrent requests, and retries for rate-limited or failed requests
+    MAX_IN_FLIGHT = 5
+    MAX_RETRIES = 3
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504, 529})
+    
+    # Pooled keep-alive connections kept per client
+    POOL_SIZE = 16
+    
     def __init__(
         self, 
         api_key: Optional[str] = None,
@@ -62,8 +197,36 @@ class ClaudeClient:
             "content-type": "application/json"
         }
         
+        # Reuse connections (and their TLS sessions) across requests
+        self.session = self._create_session()
+        
         logger.info(f"Initialized Claude client with model {self.model}")
 
+    def _create_session(self) -> requests.Session:
+        """
+        Create the HTTP session used for all API requests.
+        
+        The adapter retries failed connection attempts only; retrying on
+        HTTP status (429/5xx) is left to _with_retries, so the two don't
+        multiply each other's attempts.
+        """
+        session = requests.Session()
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            max_retries=Retry(
+                total=self.MAX_RETRIES, connect=self.MAX_RETRIES,
+                read=0, status=0, backoff_factor=0.5
+            )
+        )
+        session.mount("https://", adapter)
+        return session
+    
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
+    
     def generate_response(
         self, 
         prompt: str, 
@@ -89,37 +252,13 @@ class ClaudeClient:
             ValueError: If the prompt is empty
             RequestException: If the API request fails
         """
-        if not prompt or not prompt.strip():
-            raise ValueError("Prompt cannot be empty")
-        
-        # Prepare the context if provided
-        formatted_context = ""
-        if context and len(context) > 0:
-            formatted_context = "\n\n".join([f"CONTEXT: {ctx}" for ctx in context])
-        
-        # Construct the messages payload
-        payload = {
-            "model": self.model,
-            "max_tokens": max_tokens or self.max_tokens,
-            "temperature": temperature or self.temperature,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": f"{formatted_context}\n\n{prompt}" if formatted_context else prompt
-                }
-            ]
-        }
-        
-        # Add system prompt if provided
-        if system_prompt or self.system_prompt:
-            payload["system"] = system_prompt or self.system_prompt
+        payload = self._build_payload(prompt, context, max_tokens, temperature, system_prompt)
         
         try:
             logger.debug(f"Sending request to Claude API with model {self.model}")
-            response = requests.post(
+            response = self.session.post(
                 f"{self.BASE_URL}{self.MESSAGES_ENDPOINT}",
-                headers=self.headers,
-                json=payload,
+                data=_dumps(payload),
                 timeout=60  # 60 second timeout
             )
             
@@ -127,7 +266,7 @@ class ClaudeClient:
             response.raise_for_status()
             
             # Parse the response
-            result = response.json()
+            result = _loads(response.content)
             logger.debug("Received successful response from Claude API")
             return result
             
@@ -135,22 +274,135 @@ class ClaudeClient:
             logger.error("Timeout while connecting to Claude API")
             raise RequestException("Request to Claude API timed out")
         except RequestException as e:
-            logger.error(f"Error connecting to Claude API: {str(e)}")
-            
-            # Try to extract error details if available
-            error_details = "Unknown error"
-            if hasattr(e, "response") and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_details = error_data.get("error", {}).get("message", str(e))
-                except:
-                    error_details = e.response.text or str(e)
-            
-            raise RequestException(f"Failed to connect to Claude API: {error_details}")
+            raise self._api_error(e)
         except Exception as e:
             logger.error(f"Unexpected error while generating response: {str(e)}")
             raise
 
+    def generate_response_stream(
+        self, 
+        prompt: str, 
+        context: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_prompt: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Generate a response from Claude, yielding text as it is produced.
+        
+        Uses the streaming (server-sent events) mode of the messages API, so
+        callers can start showing the answer after the first tokens instead
+        of waiting for the whole generation.
+        
+        Args:
+            prompt: The user message to send to Claude
+            context: List of context passages to include in the prompt
+            max_tokens: Override the default max_tokens if provided
+            temperature: Override the default temperature if provided
+            system_prompt: Override the default system_prompt if provided
+            
+        Yields:
+            Text fragments of the response, in order
+            
+        Raises:
+            ValueError: If the prompt is empty
+            RequestException: If the API request fails or reports an error
+        """
+        payload = self._build_payload(prompt, context, max_tokens, temperature, system_prompt)
+        payload["stream"] = True
+        
+        try:
+            logger.debug(f"Sending streaming request to Claude API with model {self.model}")
+            with self.session.post(
+                f"{self.BASE_URL}{self.MESSAGES_ENDPOINT}",
+                data=_dumps(payload),
+                timeout=60,  # 60 second timeout between received bytes
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                
+                for line in response.iter_lines():
+                    if not line or not line.startswith(b"data:"):
+                        continue
+                    event = _loads(line[5:])
+                    event_type = event.get("type")
+                    
+                    if event_type == "content_block_delta":
+                        text = event.get("delta", {}).get("text")
+                        if text:
+                            yield text
+                    elif event_type == "message_stop":
+                        break
+                    elif event_type == "error":
+                        message = event.get("error", {}).get("message", "Unknown error")
+                        raise RequestException(f"Claude API stream error: {message}")
+            
+            logger.debug("Finished streaming response from Claude API")
+            
+        except Timeout:
+            logger.error("Timeout while connecting to Claude API")
+            raise RequestException("Request to Claude API timed out")
+        except RequestException as e:
+            raise self._api_error(e)
+
+    def _build_payload(
+        self,
+        prompt: str,
+        context: Optional[List[str]],
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        system_prompt: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Build the messages API request body.
+        
+        Raises:
+            ValueError: If the prompt is empty
+        """
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+        
+        # Construct the messages payload
+        payload = {
+            "model": self.model,
+            "max_tokens": max_tokens or self.max_tokens,
+            "temperature": temperature or self.temperature,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": format_prompt(prompt, context)
+                }
+            ]
+        }
+        
+        # Add system prompt if provided
+        if system_prompt or self.system_prompt:
+            payload["system"] = system_prompt or self.system_prompt
+        
+        return payload
+
+    def _api_error(self, e: RequestException) -> RequestException:
+        """
+        Wrap a failed request in a RequestException with the API's message.
+        
+        The HTTP response, if any, is kept on the new exception.
+        """
+        logger.error(f"Error connecting to Claude API: {str(e)}")
+            
+        # Try to extract error details if available
+        error_details = str(e) or "Unknown error"
+        if hasattr(e, "response") and e.response is not None:
+            try:
+                error_data = _loads(e.response.content)
+                error_details = error_data.get("error", {}).get("message", str(e))
+            except:
+                error_details = e.response.text or str(e)
+        
+        return RequestException(
+            f"Failed to connect to Claude API: {error_details}",
+            response=getattr(e, "response", None)
+        )
+
     def extract_response_text(self, response: Dict[str, Any]) -> str:
         """
         Extract the text content from Claude's response.
@@ -205,3 +457,169 @@ class ClaudeClient:
         """
         response = self.generate_response(prompt, context, **kwargs)
         return self.extract_response_text(response) 
+    
+    def generate_responses_batch(
+        self,
+        prompts: List[str],
+        contexts: Optional[List[Optional[List[str]]]] = None,
+        max_batch_size: Optional[int] = None,
+        max_in_flight: int = 1,
+        sort_by_length: bool = True,
+        **kwargs
+    ) -> List[str]:
+        """
+        Generate text for several prompts with as few requests as possible.
+        
+        Prompts are packed up to max_batch_size per request using batch
+        prompting, so N prompts cost ceil(N / max_batch_size) round-trips.
+        Answers the model left out of a batched response are requested
+        individually.
+        
+        Args:
+            prompts: The user messages to send to Claude
+            contexts: Context passages for each prompt (None for no context)
+            max_batch_size: Prompts per request (defaults to MAX_BATCH_SIZE)
+            max_in_flight: Batches sent concurrently (see _run_concurrent)
+            sort_by_length: Group prompts of similar length into the same
+                batch; results are still returned in input order
+            **kwargs: Additional arguments to pass to generate_response
+            
+        Returns:
+            The generated text for each prompt, in input order
+            
+        Raises:
+            ValueError: If a prompt is empty or contexts has the wrong length
+            RequestException: If an API request fails
+        """
+        if contexts is None:
+            contexts = [None] * len(prompts)
+        if len(contexts) != len(prompts):
+            raise ValueError("contexts must have one entry per prompt")
+        if any(not prompt or not prompt.strip() for prompt in prompts):
+            raise ValueError("Prompt cannot be empty")
+        
+        order = list(range(len(prompts)))
+        if sort_by_length:
+            order = length_sorted_order([
+                len(prompt) + sum(len(ctx) for ctx in context or ())
+                for prompt, context in zip(prompts, contexts)
+            ])
+            prompts = [prompts[i] for i in order]
+            contexts = [contexts[i] for i in order]
+        
+        batch_size = max(1, max_batch_size or self.MAX_BATCH_SIZE)
+        batches = [
+            (prompts[start:start + batch_size], contexts[start:start + batch_size])
+            for start in range(0, len(prompts), batch_size)
+        ]
+        batch_results = self._run_concurrent(
+            [
+                lambda batch=batch: self._generate_batch(*batch, **dict(kwargs))
+                for batch in batches
+            ],
+            max_in_flight
+        )
+        
+        # Restore the caller's order
+        results: List[str] = [""] * len(order)
+        texts = (text for batch in batch_results for text in batch)
+        for index, text in zip(order, texts):
+            results[index] = text
+        return results
+    
+    def _generate_batch(
+        self,
+        prompts: List[str],
+        contexts: List[Optional[List[str]]],
+        **kwargs
+    ) -> List[str]:
+        """Generate text for one batch of prompts with a single request."""
+        if len(prompts) == 1:
+            return [self.generate_text(prompts[0], contexts[0], **kwargs)]
+        
+        # Leave room for every answer in the combined response
+        max_tokens = kwargs.pop("max_tokens", None) or self.max_tokens
+        kwargs["max_tokens"] = min(max_tokens * len(prompts), self.MAX_OUTPUT_TOKENS)
+        
+        text = self.generate_text(build_batch_prompt(prompts, contexts), **kwargs)
+        answers = split_batch_response(text, len(prompts))
+        
+        kwargs["max_tokens"] = max_tokens
+        for i, answer in enumerate(answers):
+            if answer is None:
+                logger.warning(f"Batched response missed answer {i + 1}, retrying it alone")
+                answers[i] = self.generate_text(prompts[i], contexts[i], **kwargs)
+        return answers
+    
+    def generate_responses_concurrent(
+        self,
+        payloads: List[Dict[str, Any]],
+        max_in_flight: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several generate_response requests concurrently.
+        
+        Args:
+            payloads: Keyword arguments for generate_response, one per request
+            max_in_flight: Requests in flight at once (defaults to MAX_IN_FLIGHT)
+            
+        Returns:
+            The parsed API responses, in the order of payloads
+            
+        Raises:
+            RequestException: If a request still fails after its retries
+        """
+        return self._run_concurrent(
+            [lambda payload=payload: self.generate_response(**payload) for payload in payloads],
+            max_in_flight or self.MAX_IN_FLIGHT
+        )
+    
+    def _run_concurrent(self, calls: List[Callable[[], T]], max_in_flight: int) -> List[T]:
+        """
+        Run calls on a bounded thread pool, each with its own retries.
+        
+        Results are stored by index, so they come back in input order.
+        With a single worker (or a single call) everything runs inline.
+        """
+        if max_in_flight <= 1 or len(calls) <= 1:
+            return [self._with_retries(call) for call in calls]
+        
+        results: List[Optional[T]] = [None] * len(calls)
+        
+        def run(index: int) -> None:
+            # Spread out the first requests so they don't hit the API at once
+            time.sleep(random.uniform(0, 0.05))
+            results[index] = self._with_retries(calls[index])
+        
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for future in [executor.submit(run, i) for i in range(len(calls))]:
+                future.result()
+        return results
+    
+    def _with_retries(self, call: Callable[[], T]) -> T:
+        """
+        Call call(), retrying rate-limited and transient server errors.
+        
+        Waits for the Retry-After header when the API sends one, otherwise
+        backs off exponentially with jitter.
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                return call()
+            except RequestException as e:
+                response = getattr(e, "response", None)
+                status = getattr(response, "status_code", None)
+                if attempt == self.MAX_RETRIES or status not in self.RETRY_STATUSES:
+                    raise
+                
+                retry_after = response.headers.get("Retry-After")
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = 0.5 * 2 ** attempt + random.uniform(0, 0.1)
+                
+                logger.warning(
+                    f"Claude API returned {status}, retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{self.MAX_RETRIES})"
+                )
+                time.sleep(delay)
\ No newline at end of file
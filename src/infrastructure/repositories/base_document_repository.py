@@ -3,7 +3,10 @@ Base implementation for document repositories with common functionality.
 """
 import os
 import uuid
-from typing import Dict, List, Optional
+import logging
+import itertools
+import threading
+from typing import Dict, List, Optional, Set
 from datetime import datetime
 import magic
 
@@ -11,6 +14,41 @@ from src.entities.file import File
 from src.interfaces.repositories.document_repository import DocumentRepository
 
 
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Storage directories already created by this process
+_ENSURED_DIRS: Set[str] = set()
+
+# One libmagic handle per thread: loading the database is expensive, and a
+# handle must not be used from several threads at once
+_magic_local = threading.local()
+
+# Document IDs are a random per-process prefix plus a counter, unique
+# across processes and restarts without drawing entropy for every document
+_id_prefix = uuid.uuid4().hex
+_id_counter = itertools.count()
+
+
+def _reset_ids() -> None:
+    """Give a forked child its own ID prefix, so it cannot repeat the parent's IDs."""
+    global _id_prefix, _id_counter
+    _id_prefix = uuid.uuid4().hex
+    _id_counter = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_ids)
+
+
+def _get_magic() -> magic.Magic:
+    """Get this thread's MIME-type detector, creating it on first use."""
+    detector = getattr(_magic_local, "detector", None)
+    if detector is None:
+        detector = _magic_local.detector = magic.Magic(mime=True)
+    return detector
+
+
 class BaseDocumentRepository(DocumentRepository):
     """Base class for document repositories."""
 
@@ -24,8 +62,11 @@ class BaseDocumentRepository(DocumentRepository):
         self.storage_dir = storage_dir
         self.documents: Dict[str, File] = {}
         
-        # Create storage directory if it doesn't exist
-        os.makedirs(storage_dir, exist_ok=True)
+        # Create storage directory if it doesn't exist; repositories sharing a
+        # directory only create it once
+        if storage_dir not in _ENSURED_DIRS:
+            os.makedirs(storage_dir, exist_ok=True)
+            _ENSURED_DIRS.add(storage_dir)
 
     def get_document(self, id: str) -> Optional[File]:
         """
@@ -63,12 +104,14 @@ class BaseDocumentRepository(DocumentRepository):
             
         file = self.documents[id]
         try:
-            if os.path.exists(file.path):
+            try:
                 os.remove(file.path)
+            except FileNotFoundError:
+                pass
             del self.documents[id]
             return True
-        except Exception as e:
-            print(f"Error deleting document {id}: {str(e)}")
+        except Exception:
+            logger.exception("Error deleting document %s", id)
             return False
 
     def _get_mime_type(self, file_path: str) -> str:
@@ -81,8 +124,7 @@ class BaseDocumentRepository(DocumentRepository):
         Returns:
             MIME type of the file
         """
-        mime = magic.Magic(mime=True)
-        return mime.from_file(file_path)
+        return _get_magic().from_file(file_path)
 
     def _generate_id(self) -> str:
         """
@@ -91,7 +133,7 @@ class BaseDocumentRepository(DocumentRepository):
         Returns:
             Unique ID
         """
-        return str(uuid.uuid4())
+        return f"{_id_prefix}-{next(_id_counter)}"
 
     def _get_storage_path(self, filename: str, extension: str) -> str:
         """
@@ -15,7 +15,24 @@ class CompositeDocumentRepository(DocumentRepository):
     """
     Composite repository that delegates to specific repositories
     based on file type/extension.
+    
+    Each delegate repository is created the first time a file of its type
+    is handled, and shared by all extensions it supports.
     """
+    
+    # Map file extensions to repository classes
+    _REPO_CLASSES: Dict[str, Type[DocumentRepository]] = {
+        # PDF
+        "pdf": PDFDocumentRepository,
+        
+        # Text formats
+        "txt": TextDocumentRepository,
+        "md": TextDocumentRepository,
+        "markdown": TextDocumentRepository,
+        
+        # CSV format
+        "csv": CSVDocumentRepository
+    }
 
     def __init__(self, storage_dir: str = "./storage/documents"):
         """
@@ -25,31 +42,10 @@ class CompositeDocumentRepository(DocumentRepository):
             storage_dir: Directory to store documents
         """
         self.storage_dir = storage_dir
-        self.repositories: Dict[str, DocumentRepository] = {}
         self.documents: Dict[str, File] = {}
         
-        # Initialize repositories for different file types
-        self._init_repositories()
-        
-    def _init_repositories(self) -> None:
-        """Initialize specific repositories for each file type."""
-        pdf_repo = PDFDocumentRepository(self.storage_dir)
-        text_repo = TextDocumentRepository(self.storage_dir)
-        csv_repo = CSVDocumentRepository(self.storage_dir)
-        
-        # Map file extensions to repositories
-        self.repositories = {
-            # PDF
-            "pdf": pdf_repo,
-            
-            # Text formats
-            "txt": text_repo,
-            "md": text_repo,
-            "markdown": text_repo,
-            
-            # CSV format
-            "csv": csv_repo
-        }
+        # Repositories created so far, by class
+        self._repo_cache: Dict[Type[DocumentRepository], DocumentRepository] = {}
 
     def load_document(self, path: str) -> File:
         """
@@ -180,4 +176,11 @@ class CompositeDocumentRepository(DocumentRepository):
             DocumentRepository implementation for the extension,
             or None if not supported
         """
-        return self.repositories.get(extension.lower()) 
+        repo_class = self._REPO_CLASSES.get(extension.lower())
+        if repo_class is None:
+            return None
+        
+        repo = self._repo_cache.get(repo_class)
+        if repo is None:
+            repo = self._repo_cache[repo_class] = repo_class(self.storage_dir)
+        return repo 
@@ -2,18 +2,46 @@
 Repository implementation for CSV documents.
 """
 import os
-import csv
+import io
+import shutil
 import pandas as pd
 from datetime import datetime
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 from src.entities.file import File
 from src.infrastructure.repositories.base_document_repository import BaseDocumentRepository
 
 
+@lru_cache(maxsize=32)
+def _read_table(path: str, mtime_ns: int) -> pd.DataFrame:
+    """
+    Parse a whole CSV file with pandas' C parser.
+    
+    Cached by path and modification time, so an unchanged file is parsed
+    only once. The returned DataFrame is shared and must not be modified.
+    """
+    return pd.read_csv(path, engine="c")
+
+
 class CSVDocumentRepository(BaseDocumentRepository):
     """Repository for handling CSV documents."""
 
+    # Rows kept as the metadata sample
+    SAMPLE_ROWS = 5
+
+    def __init__(self, storage_dir: str = "./storage/documents"):
+        """
+        Initialize the repository.
+        
+        Args:
+            storage_dir: Directory to store documents
+        """
+        super().__init__(storage_dir)
+        # File ID -> (source path, content as loaded, source mtime) for
+        # loaded documents not saved yet
+        self._sources: Dict[str, Tuple[str, str, int]] = {}
+
     def load_document(self, path: str) -> File:
         """
         Load a CSV document from the given path and create a File entity.
@@ -42,17 +70,14 @@ class CSVDocumentRepository(BaseDocumentRepository):
                 )
         
         try:
-            # Use pandas to read the CSV for metadata extraction
-            df = pd.read_csv(path)
-            
-            # Read raw content for storage
+            # Read raw content for storage; metadata is parsed from it too
             with open(path, 'r', encoding='utf-8') as file:
                 content = file.read()
             
             file_id = self._generate_id()
             filename = os.path.basename(path)
             
-            metadata = self._extract_metadata_from_csv(df)
+            metadata = self._extract_metadata_from_csv(content)
             
             file = File(
                 id=file_id,
@@ -65,6 +90,7 @@ class CSVDocumentRepository(BaseDocumentRepository):
             )
             
             self.documents[file_id] = file
+            self._sources[file_id] = (path, content, os.stat(path).st_mtime_ns)
             return file
             
         except pd.errors.ParserError as e:
@@ -93,9 +119,15 @@ class CSVDocumentRepository(BaseDocumentRepository):
             # Create the storage path
             storage_path = self._get_storage_path(file.name, "csv")
             
-            # Write the content to the file
-            with open(storage_path, 'w', encoding='utf-8') as f:
-                f.write(file.content)
+            # Copy the source file when the content is still as loaded
+            # (copyfile uses the kernel's zero-copy path where available);
+            # otherwise write the content
+            if self._is_unchanged_source(file, storage_path):
+                shutil.copyfile(self._sources[file.id][0], storage_path)
+            else:
+                with open(storage_path, 'w', encoding='utf-8') as f:
+                    f.write(file.content)
+            self._sources.pop(file.id, None)
             
             # Update the file path
             file.path = storage_path
@@ -108,16 +140,48 @@ class CSVDocumentRepository(BaseDocumentRepository):
         except Exception as e:
             raise IOError(f"Error saving CSV file: {str(e)}")
 
-    def _extract_metadata_from_csv(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _is_unchanged_source(self, file: File, storage_path: str) -> bool:
         """
-        Extract metadata from a CSV file.
+        Check whether a file's source on disk still holds its content.
         
         Args:
-            df: Pandas DataFrame object
+            file: File entity being saved
+            storage_path: Path the file will be saved to
+            
+        Returns:
+            True if the source file can be copied instead of the content
+        """
+        source = self._sources.get(file.id)
+        if source is None or source[1] is not file.content:
+            return False
+        
+        path, _, mtime_ns = source
+        try:
+            if os.path.samefile(path, storage_path):
+                return False
+        except FileNotFoundError:
+            pass
+        try:
+            return os.stat(path).st_mtime_ns == mtime_ns
+        except FileNotFoundError:
+            return False
+    
+    def _extract_metadata_from_csv(self, content: str) -> Dict[str, Any]:
+        """
+        Extract metadata from CSV content.
+        
+        The content already read for the File is parsed, so the file is
+        read from disk only once. Column types are inferred by pandas over
+        the whole table.
+        
+        Args:
+            content: Text of the CSV file
             
         Returns:
             Dictionary of metadata
         """
+        df = pd.read_csv(io.StringIO(content), engine="c")
+        
         metadata = {
             "row_count": len(df),
             "column_count": len(df.columns),
@@ -125,19 +189,23 @@ class CSVDocumentRepository(BaseDocumentRepository):
             "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()}
         }
         
-        # Sample data (first 5 rows as a dictionary)
+        # Sample data (first rows as dictionaries)
         if len(df) > 0:
-            sample_rows = min(5, len(df))
-            metadata["sample"] = df.head(sample_rows).to_dict(orient="records")
+            metadata["sample"] = df.head(self.SAMPLE_ROWS).to_dict(orient="records")
         
         return metadata
     
-    def get_table_data(self, file_id: str) -> List[Dict[str, Any]]:
+    def get_table_data(
+        self, file_id: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get structured table data from a CSV file.
         
+        Parsed tables are cached until the file changes on disk.
+        
         Args:
             file_id: Document identifier
+            limit: Maximum number of rows to read (all rows if None)
             
         Returns:
             List of dictionaries representing the CSV data
@@ -153,8 +221,11 @@ class CSVDocumentRepository(BaseDocumentRepository):
             raise ValueError(f"Not a CSV file: {file.name}")
         
         try:
-            # Use pandas to read the CSV as structured data
-            df = pd.read_csv(file.path)
+            if limit is None:
+                df = _read_table(file.path, os.stat(file.path).st_mtime_ns)
+            else:
+                # Only the first rows are needed: stop parsing there
+                df = pd.read_csv(file.path, nrows=limit, engine="c")
             return df.to_dict(orient="records")
         except Exception as e:
             raise IOError(f"Error reading CSV data: {str(e)}") 
@@ -2,58 +2,209 @@
 FAISS-based implementation of the embedding repository.
 """
 import os
+import json
 import pickle
 import logging
-from typing import List, Dict, Any, Optional
+import dataclasses
+from typing import List, Dict, Any, Optional, Tuple
 
 import numpy as np
 import faiss
 
 from src.entities.embedding import Embedding
 from src.interfaces.repositories.embedding_repository import EmbeddingRepository
+from src.infrastructure.repositories.json_file import read_json, write_json
 
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 
+def _stack_vectors(embeddings: List[Embedding]) -> np.ndarray:
+    """Copy the embeddings' vectors into a new contiguous float32 matrix."""
+    return np.stack([e.vector for e in embeddings]).astype(np.float32, copy=False)
+
+
+def _encode_records(
+    embeddings: List[Embedding],
+    vectors: Optional[np.ndarray] = None,
+    first_seq: Optional[int] = None
+) -> Tuple[bytes, str]:
+    """
+    Encode embeddings as raw float32 vector rows and JSON lines.
+    
+    The vectors are stored apart from the other fields, one row per
+    embedding, so they can be read back as a single matrix. vectors, if
+    given, is the embeddings' matrix from _stack_vectors. If first_seq is
+    given, the records are numbered consecutively from it.
+    """
+    if vectors is None:
+        vectors = _stack_vectors(embeddings)
+    records = [
+        {
+            "id": e.id,
+            "text": e.text,
+            "document_id": e.document_id,
+            "chunk_id": e.chunk_id,
+            "metadata": e.metadata
+        }
+        for e in embeddings
+    ]
+    if first_seq is not None:
+        for seq, record in enumerate(records, first_seq):
+            record["seq"] = seq
+    lines = "".join(
+        json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        for record in records
+    )
+    return vectors.tobytes(), lines
+
+
+def _decode_record(record: Dict[str, Any], vector: np.ndarray) -> Embedding:
+    """Rebuild an embedding from its JSON record and vector row."""
+    return Embedding(
+        id=record["id"],
+        vector=vector,
+        text=record["text"],
+        document_id=record.get("document_id"),
+        chunk_id=record.get("chunk_id"),
+        metadata=record.get("metadata") or {}
+    )
+
+
+def _read_records(path: str) -> List[Dict[str, Any]]:
+    """Read a JSON-lines file, stopping at a partially written last line."""
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+    return records
+
+
+def _fsync(path: str) -> None:
+    """Flush a written file to disk."""
+    with open(path, "rb+") as f:
+        os.fsync(f.fileno())
+
+
 class FAISSEmbeddingRepository(EmbeddingRepository):
     """FAISS-based implementation of the embedding repository."""
     
-    def __init__(self, index_path: str = None, dimension: int = 1536):
+    # HNSW graph parameters: neighbors per node and the build-time and
+    # default search-time beam widths
+    HNSW_NEIGHBORS = 32
+    HNSW_EF_CONSTRUCTION = 200
+    HNSW_EF_SEARCH = 64
+    
+    # Vectors converted and added to the index per call
+    ADD_CHUNK_SIZE = 4096
+    # Logged embeddings that trigger a rewrite of the index files
+    COMPACT_EVERY = 1024
+    # Memory-map saved indexes on load instead of reading them into memory
+    MMAP_INDEX = True
+    # Vectors a quantized repository collects before training its quantizer
+    QUANTIZER_TRAIN_SIZE = 1000
+    
+    def __init__(
+        self,
+        index_path: str = None,
+        dimension: int = 1536,
+        ef_search: Optional[int] = None,
+        quantized: bool = False
+    ):
         """
         Initialize the FAISS embedding repository.
         
         Args:
             index_path: Path to load/save the FAISS index
             dimension: Dimension of the embedding vectors
+            ef_search: HNSW search beam width; higher is slower but finds
+                the true nearest neighbors more often
+            quantized: Store vectors as 8-bit codes instead of float32, a
+                quarter of the memory at some cost in accuracy. The quantizer
+                is trained on the stored vectors once QUANTIZER_TRAIN_SIZE
+                have been added; until then vectors are kept as float32
         """
         self.index_path = index_path
         self.dimension = dimension
+        self._ef_search = ef_search or self.HNSW_EF_SEARCH
+        self.quantized = quantized
         self.embeddings: Dict[str, Embedding] = {}
+        # Embedding ID stored at each FAISS index position
+        self._id_by_row: List[str] = []
+        # Embeddings in the append-only log
+        self._logged = 0
+        # Sequence number of the last logged embedding, and of the last one
+        # included in the saved index files
+        self._seq = 0
+        self._saved_seq = 0
+        # Generation of the saved index files; None for the unversioned
+        # files written by earlier versions
+        self._generation: Optional[int] = None
+        # Whether self.index is a read-only memory map of the index file
+        self._mapped = False
         self.index = None
         
         # Initialize FAISS index
         self._initialize_index()
         
         # Load existing index if provided
-        if index_path and os.path.exists(index_path):
+        if index_path:
             self.load_index()
     
     def _initialize_index(self) -> None:
         """Initialize the FAISS index."""
         try:
-            # Create a flat L2 index (exact search)
-            self.index = faiss.IndexFlatL2(self.dimension)
+            # Create an HNSW graph index (approximate search) over normalized
+            # vectors, so the inner product equals the cosine similarity
+            self.index = faiss.IndexHNSWFlat(
+                self.dimension, self.HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT
+            )
+            self.index.hnsw.efConstruction = self.HNSW_EF_CONSTRUCTION
+            self.ef_search = self._ef_search
+            self._mapped = False
+            self._id_by_row = []
             logger.info(f"FAISS index initialized with dimension {self.dimension}")
         except Exception as e:
             logger.error(f"Error initializing FAISS index: {str(e)}")
             raise ValueError(f"Failed to initialize FAISS index: {str(e)}")
     
+    @property
+    def ef_search(self) -> int:
+        """Get the HNSW search beam width."""
+        return self._ef_search
+    
+    @ef_search.setter
+    def ef_search(self, value: int) -> None:
+        """Set the HNSW search beam width, applied to the current index."""
+        self._ef_search = value
+        # Indexes saved with the previous flat layout have no HNSW graph
+        index = faiss.downcast_index(self.index)
+        if isinstance(index, faiss.IndexHNSW):
+            index.hnsw.efSearch = value
+    
+    def _prepare_vectors(self, vectors: List[List[float]]) -> np.ndarray:
+        """
+        Convert vectors to the float32 matrix expected by the index.
+        
+        Vectors are L2-normalized for inner-product indexes; indexes saved
+        with the previous flat L2 layout are searched with raw vectors.
+        """
+        matrix = np.ascontiguousarray(np.stack(vectors), dtype=np.float32)
+        if self.index.metric_type == faiss.METRIC_INNER_PRODUCT:
+            faiss.normalize_L2(matrix)
+        return matrix
+    
     def save_embedding(self, embedding: Embedding) -> bool:
         """
         Save an embedding to the repository.
         
+        The embedding is appended to the repository's log files; the full
+        index is only rewritten every COMPACT_EVERY logged embeddings.
+        
         Args:
             embedding: The embedding to save
             
@@ -61,25 +212,285 @@ class FAISSEmbeddingRepository(EmbeddingRepository):
             True if the embedding was saved successfully, False otherwise
         """
         try:
-            # Convert the embedding vector to numpy array
-            vector = np.array([embedding.vector], dtype=np.float32)
+            vectors = _stack_vectors([embedding])
+            self._append_log([embedding], vectors)
+            self._add([embedding], vectors)
+            
+            if self._logged >= self.COMPACT_EVERY:
+                self.compact()
             
-            # Add to FAISS index
-            self.index.add(vector)
+            logger.debug("Embedding %s saved successfully", embedding.id)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving embedding {embedding.id}: {str(e)}")
+            return False
+    
+    def save_embeddings(self, embeddings: List[Embedding]) -> bool:
+        """
+        Save several embeddings, adding them to the index in one call.
+        
+        The batch is appended to the repository's log files in one write.
+        
+        Args:
+            embeddings: The embeddings to save
             
-            # Store the embedding object
-            self.embeddings[embedding.id] = embedding
+        Returns:
+            True if the embeddings were saved successfully, False otherwise
+        """
+        if not embeddings:
+            return True
+        
+        try:
+            # One matrix for the log and the index
+            vectors = _stack_vectors(embeddings)
+            self._append_log(embeddings, vectors)
+            self._add(embeddings, vectors)
             
-            # Save the index if path is provided
-            if self.index_path:
-                self.save_index()
+            if self._logged >= self.COMPACT_EVERY:
+                self.compact()
             
-            logger.info(f"Embedding {embedding.id} saved successfully")
+            logger.info("%d embeddings saved successfully", len(embeddings))
             return True
         except Exception as e:
-            logger.error(f"Error saving embedding {embedding.id}: {str(e)}")
+            logger.error(f"Error saving {len(embeddings)} embeddings: {str(e)}")
             return False
     
+    def compact(self) -> bool:
+        """
+        Rewrite the index files with every embedding and empty the log.
+        
+        Returns:
+            True if successfully compacted, False otherwise
+        """
+        if not self.index_path or not self.save_index():
+            return False
+        
+        try:
+            for path in self._log_paths():
+                if os.path.exists(path):
+                    open(path, "wb").close()
+            self._logged = 0
+            return True
+        except Exception as e:
+            logger.error(f"Error truncating embedding log: {str(e)}")
+            return False
+    
+    def _load_row_ids(self, ids_path: str) -> List[str]:
+        """
+        Load the embedding ID of each index position.
+        
+        Index files saved without the ID list hold each embedding once, in
+        the embeddings dictionary's order.
+        """
+        if os.path.exists(ids_path):
+            ids = read_json(ids_path)
+            if len(ids) == self.index.ntotal:
+                return ids
+            logger.warning("Embedding ID list does not match the index, rebuilding it")
+        return list(self.embeddings.keys())
+    
+    def _read_index(self, faiss_path: str, mapped: bool) -> None:
+        """Read the index file, memory-mapped read-only or into memory."""
+        if mapped:
+            self.index = faiss.read_index(
+                faiss_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            )
+        else:
+            self.index = faiss.read_index(faiss_path)
+        self._mapped = mapped
+        self.ef_search = self._ef_search
+    
+    def _ensure_writable(self) -> None:
+        """Replace a memory-mapped index with an in-memory copy before adding."""
+        if self._mapped:
+            self._read_index(self._paths(self._generation)[0], mapped=False)
+    
+    def _manifest_path(self) -> str:
+        """Path of the file naming the current generation of index files."""
+        return f"{self.index_path}.manifest.json"
+    
+    def _paths(self, generation: Optional[int]) -> Tuple[str, str, str, str]:
+        """
+        Paths of a generation's index, vector, records and row ID files.
+        
+        Generation None is the unversioned layout of earlier versions.
+        """
+        base = self.index_path if generation is None else f"{self.index_path}.{generation}"
+        return (
+            f"{base}.faiss", f"{base}.vectors.f32",
+            f"{base}.records.jsonl", f"{base}.ids.json"
+        )
+    
+    def _remove_generation(self, generation: Optional[int]) -> None:
+        """Delete a superseded generation's index files."""
+        paths = list(self._paths(generation))
+        if generation is None:
+            # The pickle written before the columnar store
+            paths.append(f"{self.index_path}.pkl")
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    
+    def _write_store(
+        self, vector_path: str, records_path: str, embeddings: List[Embedding]
+    ) -> None:
+        """Write the embeddings' vector and records files."""
+        if embeddings:
+            vectors, lines = _encode_records(embeddings)
+        else:
+            vectors, lines = b"", ""
+        
+        with open(vector_path, "wb") as f:
+            f.write(vectors)
+        with open(records_path, "w", encoding="utf-8") as f:
+            f.write(lines)
+    
+    def _read_store(self, vector_path: str, records_path: str) -> Dict[str, Embedding]:
+        """Read the embeddings saved by _write_store."""
+        records = _read_records(records_path)
+        
+        # One read for all vectors; each embedding gets a row of the matrix
+        matrix = np.fromfile(vector_path, dtype=np.float32).reshape(-1, self.index.d)
+        if len(matrix) != len(records):
+            raise ValueError("Embedding vector and record files do not match")
+        
+        return {
+            record["id"]: _decode_record(record, matrix[i])
+            for i, record in enumerate(records)
+        }
+    
+    def _log_paths(self) -> Tuple[str, str]:
+        """Paths of the log's vector file and metadata file."""
+        return f"{self.index_path}.wal.f32", f"{self.index_path}.meta.jsonl"
+    
+    def _append_log(
+        self, embeddings: List[Embedding], vectors: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Append embeddings to the log files.
+        
+        Vectors go to a raw float32 file, one row per embedding, and the
+        other fields to a JSON-lines file.
+        """
+        if not self.index_path:
+            return
+        
+        vectors, lines = _encode_records(embeddings, vectors, self._seq + 1)
+        self._seq += len(embeddings)
+        
+        directory = os.path.dirname(self.index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        vector_path, meta_path = self._log_paths()
+        with open(vector_path, "ab") as f:
+            f.write(vectors)
+        with open(meta_path, "a", encoding="utf-8") as f:
+            f.write(lines)
+        self._logged += len(embeddings)
+    
+    def _replay_log(self) -> int:
+        """
+        Add the embeddings recorded in the log files to the index.
+        
+        Entries are replayed in log order, so a later entry for an ID
+        replaces an earlier one. Entries numbered up to the saved files'
+        sequence number are already in them (left behind by a compaction
+        interrupted before it emptied the log) and are skipped.
+        
+        Returns:
+            Number of log entries read
+        """
+        vector_path, meta_path = self._log_paths()
+        if not os.path.exists(meta_path) or not os.path.exists(vector_path):
+            return 0
+        
+        records = _read_records(meta_path)
+        
+        dimension = self.index.d
+        row_count = os.path.getsize(vector_path) // (4 * dimension)
+        count = min(len(records), row_count)
+        if count:
+            # One read for all vectors; each embedding gets a row of the matrix
+            rows = np.fromfile(
+                vector_path, dtype=np.float32, count=count * dimension
+            ).reshape(count, dimension)
+            # Entries logged before sequence numbers were added are replayed
+            embeddings = [
+                _decode_record(record, rows[i])
+                for i, record in enumerate(records[:count])
+                if record.get("seq", self._saved_seq + 1) > self._saved_seq
+            ]
+            if embeddings:
+                self._add(embeddings)
+            self._seq = max(
+                [self._seq] + [r["seq"] for r in records[:count] if "seq" in r]
+            )
+        self._logged = count
+        
+        # An interrupted append left the two files out of step
+        if len(records) != row_count or os.path.getsize(vector_path) % (4 * dimension):
+            self.compact()
+        
+        return count
+    
+    def _add(
+        self, embeddings: List[Embedding], vectors: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Add embeddings to the index, ADD_CHUNK_SIZE vectors at a time.
+        
+        vectors, if given, is a matrix from _stack_vectors for these
+        embeddings; it is normalized in place.
+        """
+        self._ensure_writable()
+        is_cosine = self.index.metric_type == faiss.METRIC_INNER_PRODUCT
+        for start in range(0, len(embeddings), self.ADD_CHUNK_SIZE):
+            chunk = embeddings[start:start + self.ADD_CHUNK_SIZE]
+            if vectors is None:
+                block = _stack_vectors(chunk)
+            else:
+                block = vectors[start:start + self.ADD_CHUNK_SIZE]
+            if is_cosine:
+                faiss.normalize_L2(block)
+            self.index.add(block)
+            
+            # Store the embedding objects
+            for embedding in chunk:
+                self.embeddings[embedding.id] = embedding
+                self._id_by_row.append(embedding.id)
+        
+        if (self.quantized and is_cosine
+                and self.index.ntotal >= self.QUANTIZER_TRAIN_SIZE
+                and not isinstance(faiss.downcast_index(self.index), faiss.IndexHNSWSQ)):
+            self._quantize_index()
+    
+    def _quantize_index(self) -> None:
+        """
+        Rebuild the index with 8-bit scalar-quantized vectors.
+        
+        The quantizer learns each dimension's range from the stored vectors;
+        a fixed range such as [-1, 1] would leave most of the 256 levels
+        unused, since components of high-dimensional unit vectors are small.
+        """
+        vectors = _stack_vectors([self.embeddings[id] for id in self._id_by_row])
+        faiss.normalize_L2(vectors)
+        
+        index = faiss.IndexHNSWSQ(
+            self.dimension, faiss.ScalarQuantizer.QT_8bit,
+            self.HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT
+        )
+        index.hnsw.efConstruction = self.HNSW_EF_CONSTRUCTION
+        index.train(vectors)
+        for start in range(0, len(vectors), self.ADD_CHUNK_SIZE):
+            index.add(vectors[start:start + self.ADD_CHUNK_SIZE])
+        
+        self.index = index
+        self.ef_search = self._ef_search
+        logger.info("Quantized FAISS index built from %d vectors", len(vectors))
+    
     def get_embedding(self, id: str) -> Optional[Embedding]:
         """
         Get an embedding by its ID.
@@ -103,36 +514,75 @@ class FAISSEmbeddingRepository(EmbeddingRepository):
             top_k: Number of similar embeddings to return
             
         Returns:
-            List of similar embeddings, ordered by similarity (most similar first)
+            List of similar embeddings, ordered by similarity (most similar
+            first); for cosine indexes each is a copy with the similarity in
+            its "score" metadata
+        """
+        return self.search_similar_batch([query_embedding], top_k)[0]
+    
+    def search_similar_batch(
+        self, query_embeddings: List[List[float]], top_k: int = 5
+    ) -> List[List[Embedding]]:
+        """
+        Search for embeddings similar to each of several queries.
+        
+        All queries go to FAISS in a single search call, which spreads
+        them over its threads.
+        
+        Args:
+            query_embeddings: The query embedding vectors
+            top_k: Number of similar embeddings to return per query
+            
+        Returns:
+            One list of similar embeddings per query, ordered by similarity
+            (most similar first); for cosine indexes each is a copy with the
+            similarity in its "score" metadata
         """
+        if not query_embeddings:
+            return []
+        
         try:
             # Ensure we don't request more items than we have
             actual_top_k = min(top_k, len(self.embeddings))
             
             if actual_top_k == 0:
                 logger.warning("No embeddings to search in")
-                return []
+                return [[] for _ in query_embeddings]
             
-            # Convert query to numpy array
-            query_vector = np.array([query_embedding], dtype=np.float32)
+            # Convert queries to a numpy matrix
+            query_vectors = self._prepare_vectors(query_embeddings)
             
             # Search in the index
-            distances, indices = self.index.search(query_vector, actual_top_k)
+            distances, indices = self.index.search(query_vectors, actual_top_k)
             
-            # Map indices to embeddings
-            results = []
-            embedding_ids = list(self.embeddings.keys())
+            is_cosine = self.index.metric_type == faiss.METRIC_INNER_PRODUCT
+            all_results = []
             
-            for idx in indices[0]:
-                if 0 <= idx < len(embedding_ids):
-                    embedding_id = embedding_ids[idx]
-                    results.append(self.embeddings[embedding_id])
+            for row_distances, row_indices in zip(distances, indices):
+                # Map indices to embeddings; an ID saved more than once
+                # occupies several positions but is returned only once
+                results = []
+                seen = set()
+                for distance, idx in zip(row_distances, row_indices):
+                    if 0 <= idx < len(self._id_by_row) and self._id_by_row[idx] not in seen:
+                        embedding_id = self._id_by_row[idx]
+                        seen.add(embedding_id)
+                        embedding = self.embeddings[embedding_id]
+                        if is_cosine:
+                            # Score a copy: the stored embedding is shared
+                            # by every search and saved by compact()
+                            embedding = dataclasses.replace(
+                                embedding,
+                                metadata={**embedding.metadata, "score": float(distance)}
+                            )
+                        results.append(embedding)
+                all_results.append(results)
             
-            logger.info(f"Found {len(results)} similar embeddings")
-            return results
+            logger.debug("Searched similar embeddings for %d queries", len(all_results))
+            return all_results
         except Exception as e:
             logger.error(f"Error searching similar embeddings: {str(e)}")
-            return []
+            return [[] for _ in query_embeddings]
     
     def list_embeddings(self) -> List[Embedding]:
         """
@@ -147,6 +597,12 @@ class FAISSEmbeddingRepository(EmbeddingRepository):
         """
         Save the FAISS index and embeddings to disk.
         
+        Embeddings are stored as a float32 matrix file plus a JSON-lines
+        file with the other fields. Each save writes a new generation of
+        files beside the current one and then switches the manifest to it
+        in one atomic replace, so a crash mid-save leaves the previous
+        generation in use.
+        
         Returns:
             True if successfully saved, False otherwise
         """
@@ -158,12 +614,24 @@ class FAISSEmbeddingRepository(EmbeddingRepository):
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
             
-            # Save the FAISS index
-            faiss.write_index(self.index, f"{self.index_path}.faiss")
+            generation = (self._generation or 0) + 1
+            paths = self._paths(generation)
+            faiss_path, vector_path, records_path, ids_path = paths
             
-            # Save the embeddings dictionary
-            with open(f"{self.index_path}.pkl", "wb") as f:
-                pickle.dump(self.embeddings, f)
+            # Save the FAISS index, the embeddings and the embedding ID of
+            # each index position
+            faiss.write_index(self.index, faiss_path)
+            self._write_store(vector_path, records_path, list(self.embeddings.values()))
+            write_json(ids_path, self._id_by_row)
+            for path in paths:
+                _fsync(path)
+            
+            # Switch to the new files; the old ones may still be
+            # memory-mapped, which keeps them readable once deleted
+            write_json(self._manifest_path(), {"generation": generation, "seq": self._seq})
+            previous, self._generation = self._generation, generation
+            self._saved_seq = self._seq
+            self._remove_generation(previous)
             
             logger.info(f"FAISS index saved to {self.index_path}")
             return True
@@ -183,20 +651,40 @@ class FAISSEmbeddingRepository(EmbeddingRepository):
             return False
         
         try:
+            # Find the current generation of index files
+            generation, saved_seq = None, 0
+            if os.path.exists(self._manifest_path()):
+                manifest = read_json(self._manifest_path())
+                generation, saved_seq = manifest["generation"], manifest["seq"]
+            
             # Check if files exist
-            faiss_path = f"{self.index_path}.faiss"
+            faiss_path, vector_path, records_path, ids_path = self._paths(generation)
             pkl_path = f"{self.index_path}.pkl"
             
-            if not os.path.exists(faiss_path) or not os.path.exists(pkl_path):
-                logger.warning("Index files not found, creating new index")
-                return False
+            has_store = os.path.exists(vector_path) and os.path.exists(records_path)
+            has_index = os.path.exists(faiss_path) and (has_store or os.path.exists(pkl_path))
+            if has_index:
+                # Load the FAISS index, mapped so vectors are paged in on
+                # demand; search parameters are not saved
+                self._read_index(faiss_path, mapped=self.MMAP_INDEX)
+                
+                # Load the embeddings; indexes saved before the columnar
+                # store have them in a pickled dictionary
+                if has_store:
+                    self.embeddings = self._read_store(vector_path, records_path)
+                else:
+                    with open(pkl_path, "rb") as f:
+                        self.embeddings = pickle.load(f)
+                self._id_by_row = self._load_row_ids(ids_path)
+                self._generation = generation
+                self._seq = self._saved_seq = saved_seq
             
-            # Load the FAISS index
-            self.index = faiss.read_index(faiss_path)
+            # Add the embeddings saved since the index files were written
+            logged = self._replay_log()
             
-            # Load the embeddings dictionary
-            with open(pkl_path, "rb") as f:
-                self.embeddings = pickle.load(f)
+            if not has_index and not logged:
+                logger.warning("Index files not found, creating new index")
+                return False
             
             logger.info(f"FAISS index loaded from {self.index_path}")
             logger.info(f"Loaded {len(self.embeddings)} embeddings")
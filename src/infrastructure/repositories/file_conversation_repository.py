@@ -2,19 +2,52 @@
 File-based implementation of the ConversationRepository.
 """
 import os
-import json
+import re
 import time
+import heapq
 import logging
-from typing import List, Optional
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Tuple
 from datetime import datetime
 
 from src.entities.conversation import Conversation
 from src.interfaces.repositories.conversation_repository import ConversationRepository
+from src.infrastructure.repositories.json_file import read_json, write_json
 
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Subjects recognized in user messages (this could be enhanced with NLP)
+TOPIC_KEYWORDS = (
+    "matemática", "física", "química", "biologia", "história", "geografia",
+    "literatura", "gramática", "redação", "inglês", "filosofia", "sociologia"
+)
+
+# Matches any topic keyword in any case, so all of them are found in a
+# single scan without lowercasing the message first
+_TOPIC_PATTERN = re.compile(
+    "|".join(re.escape(k) for k in TOPIC_KEYWORDS), re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _topics_in(content: str) -> FrozenSet[str]:
+    """
+    Get the topic keywords found in a message.
+    
+    Cached per message text, since the whole history is scanned again
+    every time the context file is updated. Text with decomposed accents
+    (as some keyboards and clipboards produce) is composed first so it
+    matches the keywords.
+    """
+    if not unicodedata.is_normalized("NFC", content):
+        content = unicodedata.normalize("NFC", content)
+    return frozenset(match.lower() for match in _TOPIC_PATTERN.findall(content))
+
 
 class FileConversationRepository(ConversationRepository):
     """
@@ -24,6 +57,11 @@ class FileConversationRepository(ConversationRepository):
     in Markdown format (FLIPFLOP.md) according to the MCP pattern.
     """
     
+    # Conversation files kept decoded by the read cache
+    CACHE_SIZE = 128
+    # Threads reading conversation files in list_recent_conversations
+    MAX_LOAD_WORKERS = 8
+    
     def __init__(self, storage_dir: str, context_file_path: str):
         """
         Initialize the repository with the specified storage directory.
@@ -34,6 +72,10 @@ class FileConversationRepository(ConversationRepository):
         """
         self.storage_dir = storage_dir
         self.context_file_path = context_file_path
+        # Conversation file name -> (file mtime in ns, decoded file content).
+        # Callers get a new Conversation built from the content, so changes
+        # they make never reach the cache
+        self._cache: "OrderedDict[str, Tuple[int, dict]]" = OrderedDict()
         
         # Create storage directory if it doesn't exist
         if not os.path.exists(storage_dir):
@@ -65,8 +107,8 @@ class FileConversationRepository(ConversationRepository):
             data = conversation.to_dict()
             
             # Save to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            write_json(file_path, data)
+            self._cache_put(os.path.basename(file_path), os.stat(file_path).st_mtime_ns, data)
             
             logger.info(f"Saved conversation to {file_path}")
             
@@ -82,6 +124,10 @@ class FileConversationRepository(ConversationRepository):
         """
         Get a conversation by ID.
         
+        The file is only decoded again when it has changed since it was
+        last loaded or saved through this repository. Each call returns a
+        new Conversation, which the caller may change freely.
+        
         Args:
             id: The conversation ID
             
@@ -92,16 +138,13 @@ class FileConversationRepository(ConversationRepository):
             file_path = self._get_file_path(id)
             
             # Check if file exists
-            if not os.path.exists(file_path):
+            try:
+                mtime_ns = os.stat(file_path).st_mtime_ns
+            except FileNotFoundError:
                 logger.warning(f"Conversation file not found: {file_path}")
                 return None
             
-            # Load from file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Deserialize to Conversation object
-            conversation = Conversation.from_dict(data)
+            conversation = self._load(os.path.basename(file_path), mtime_ns)
             logger.info(f"Loaded conversation: {id}")
             
             return conversation
@@ -125,6 +168,10 @@ class FileConversationRepository(ConversationRepository):
         """
         List recent conversations, ordered by update time.
         
+        Files are picked by modification time, which is when each
+        conversation was last saved, so only the newest limit files are
+        read.
+        
         Args:
             limit: Maximum number of conversations to return (default 10)
             
@@ -132,22 +179,38 @@ class FileConversationRepository(ConversationRepository):
             List of conversations
         """
         try:
-            # Get all JSON files in the storage directory
-            files = [f for f in os.listdir(self.storage_dir) 
-                   if f.endswith('.json') and os.path.isfile(os.path.join(self.storage_dir, f))]
+            # Get all JSON files in the storage directory with their
+            # modification times (scandir entries carry the stat result)
+            with os.scandir(self.storage_dir) as entries:
+                candidates = [
+                    (entry.stat().st_mtime_ns, entry.name) for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()
+                ]
             
+            if limit > 0:
+                candidates = heapq.nlargest(limit, candidates)
             conversations = []
             
+            # Read the files that are not cached in parallel; file reads
+            # release the GIL
+            missing = [
+                file_name for mtime_ns, file_name in candidates
+                if self._cached(file_name, mtime_ns) is None
+            ]
+            loaded = {}
+            if len(missing) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.MAX_LOAD_WORKERS, len(missing))
+                ) as executor:
+                    loaded = dict(zip(missing, executor.map(self._read_file, missing)))
+            
             # Load each file
-            for file_name in files:
+            for mtime_ns, file_name in candidates:
                 try:
-                    file_path = os.path.join(self.storage_dir, file_name)
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Deserialize to Conversation object
-                    conversation = Conversation.from_dict(data)
-                    conversations.append(conversation)
+                    data = loaded.get(file_name)
+                    if isinstance(data, Exception):
+                        raise data
+                    conversations.append(self._load(file_name, mtime_ns, data))
                 except Exception as e:
                     logger.error(f"Error loading conversation from {file_name}: {e}")
             
@@ -180,6 +243,7 @@ class FileConversationRepository(ConversationRepository):
             for file_name in files:
                 file_path = os.path.join(self.storage_dir, file_name)
                 os.remove(file_path)
+            self._cache.clear()
             
             # Reset the context file
             self._initialize_context_file()
@@ -214,6 +278,51 @@ class FileConversationRepository(ConversationRepository):
             logger.exception(f"Error updating context file: {e}")
             return False
     
+    def _load(self, file_name: str, mtime_ns: int, data: Optional[dict] = None) -> Conversation:
+        """
+        Load a conversation file, reusing the cached content if unchanged.
+        
+        Args:
+            file_name: Name of the file in the storage directory
+            mtime_ns: Current modification time of the file
+            data: The file's decoded JSON, if already read
+            
+        Returns:
+            A new conversation built from the file's content
+        """
+        cached = self._cached(file_name, mtime_ns)
+        if cached is not None:
+            return Conversation.from_dict(cached)
+        
+        # Deserialize to Conversation object
+        if data is None:
+            data = read_json(os.path.join(self.storage_dir, file_name))
+        conversation = Conversation.from_dict(data)
+        self._cache_put(file_name, mtime_ns, data)
+        return conversation
+    
+    def _cached(self, file_name: str, mtime_ns: int) -> Optional[dict]:
+        """Get the cached content of a file if the file is unchanged."""
+        cached = self._cache.get(file_name)
+        if cached is None or cached[0] != mtime_ns:
+            return None
+        self._cache.move_to_end(file_name)
+        return cached[1]
+    
+    def _read_file(self, file_name: str):
+        """Decode a conversation file, returning the error instead of raising it."""
+        try:
+            return read_json(os.path.join(self.storage_dir, file_name))
+        except Exception as e:
+            return e
+    
+    def _cache_put(self, file_name: str, mtime_ns: int, data: dict) -> None:
+        """Cache the decoded content of a file at a given mtime."""
+        self._cache[file_name] = (mtime_ns, data)
+        self._cache.move_to_end(file_name)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
     def _get_file_path(self, id: str) -> str:
         """
         Get the file path for a conversation.
@@ -279,20 +388,18 @@ No references yet.
         topics = self._extract_topics_from_messages(messages)
         
         # Format messages for markdown
-        message_history = ""
+        parts = []
         for msg in messages[-10:]:  # Only include the last 10 messages
             role_icon = "👤" if msg.role == "user" else "🤖"
             timestamp = datetime.fromtimestamp(msg.timestamp).strftime("%Y-%m-%d %H:%M:%S")
-            message_history += f"### {role_icon} {timestamp}\n{msg.content}\n\n"
-        
-        if not message_history:
-            message_history = "No conversation history yet.\n"
+            parts.append(f"### {role_icon} {timestamp}\n")
+            parts.append(msg.content)
+            parts.append("\n\n")
+        message_history = "".join(parts) or "No conversation history yet.\n"
         
         # Format topics for markdown
-        topics_section = ""
         if topics:
-            for topic in topics:
-                topics_section += f"- {topic}\n"
+            topics_section = "".join(f"- {topic}\n" for topic in topics)
         else:
             topics_section = "No topics discussed yet.\n"
         
@@ -336,19 +443,10 @@ No performance data tracked yet.
         Returns:
             List of topics
         """
-        # Simple keyword extraction (this could be enhanced with NLP)
-        keywords = [
-            "matemática", "física", "química", "biologia", "história", "geografia",
-            "literatura", "gramática", "redação", "inglês", "filosofia", "sociologia"
-        ]
-        
-        topics = set()
-        
+        # Only messages not seen before are scanned
+        found = set()
         for msg in messages:
             if msg.role == "user":
-                content = msg.content.lower()
-                for keyword in keywords:
-                    if keyword.lower() in content:
-                        topics.add(keyword)
+                found |= _topics_in(msg.content)
         
-        return list(topics) 
+        return [keyword for keyword in TOPIC_KEYWORDS if keyword in found] 
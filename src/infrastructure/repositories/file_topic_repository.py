@@ -2,11 +2,11 @@
 File-based implementation of the TopicRepository.
 """
 import os
-import json
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 
 from src.interfaces.repositories.topic_repository import TopicRepository
+from src.infrastructure.repositories.json_file import read_json, write_json
 
 
 # Configure logger
@@ -27,6 +27,9 @@ class FileTopicRepository(TopicRepository):
         """
         self.storage_dir = storage_dir
         self.topics_file = os.path.join(storage_dir, "topics.json")
+        # Topics as stored in topics_file, loaded on first use
+        self._topics: Optional[List[str]] = None
+        self._topic_set: Set[str] = set()
         
         # Create storage directory if it doesn't exist
         if not os.path.exists(storage_dir):
@@ -52,12 +55,11 @@ class FileTopicRepository(TopicRepository):
         """
         try:
             # Get existing topics
-            topics = self.list_topics()
+            topics = self._load_topics()
             
             # Add topic if it doesn't exist
-            if topic not in topics:
-                topics.append(topic)
-                self._save_topics(topics)
+            if topic not in self._topic_set:
+                self._save_topics(topics + [topic])
                 logger.info(f"Saved topic: {topic}")
             
             return True
@@ -77,12 +79,11 @@ class FileTopicRepository(TopicRepository):
         """
         try:
             # Get existing topics
-            topics = self.list_topics()
+            topics = self._load_topics()
             
             # Remove topic if it exists
-            if topic in topics:
-                topics.remove(topic)
-                self._save_topics(topics)
+            if topic in self._topic_set:
+                self._save_topics([t for t in topics if t != topic])
                 logger.info(f"Deleted topic: {topic}")
             
             return True
@@ -98,15 +99,7 @@ class FileTopicRepository(TopicRepository):
             A list of topics
         """
         try:
-            # Load topics from file
-            if not os.path.exists(self.topics_file):
-                return []
-            
-            with open(self.topics_file, "r", encoding="utf-8") as f:
-                topics = json.load(f)
-            
-            logger.debug(f"Loaded {len(topics)} topics")
-            return topics
+            return list(self._load_topics())
         except Exception as e:
             logger.exception(f"Error listing topics: {e}")
             return []
@@ -128,10 +121,26 @@ class FileTopicRepository(TopicRepository):
     
     def _save_topics(self, topics: List[str]) -> None:
         """
-        Save topics to file.
+        Save topics to file and keep them as the cached list.
         
         Args:
             topics: The list of topics to save
         """
-        with open(self.topics_file, "w", encoding="utf-8") as f:
-            json.dump(topics, f, ensure_ascii=False, indent=2) 
+        write_json(self.topics_file, topics)
+        self._topics = topics
+        self._topic_set = set(topics)
+    
+    def _load_topics(self) -> List[str]:
+        """
+        Get the stored topics, reading the file only the first time.
+        
+        Returns:
+            The cached list of topics (not to be modified in place)
+        """
+        if self._topics is None:
+            # Load topics from file
+            topics = read_json(self.topics_file) if os.path.exists(self.topics_file) else []
+            logger.debug(f"Loaded {len(topics)} topics")
+            self._topics = topics
+            self._topic_set = set(topics)
+        return self._topics 
@@ -0,0 +1,59 @@
+"""
+JSON file helpers shared by the file-based repositories.
+
+orjson is used when it is installed, since it is several times faster than
+the standard json module; otherwise the standard module is used. Both write
+UTF-8 text indented by two spaces.
+"""
+import os
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def read_json(path: str) -> Any:
+    """
+    Load JSON data from a file.
+    
+    Args:
+        path: Path of the JSON file
+        
+    Returns:
+        The decoded data
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json(path: str, data: Any) -> None:
+    """
+    Write data to a file as JSON.
+    
+    The data is written to a temporary file that then replaces the target,
+    so readers never see a partially written file.
+    
+    Args:
+        path: Path of the JSON file
+        data: The data to encode; NumPy arrays are supported with orjson
+    """
+    if orjson is not None:
+        payload = orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    else:
+        # Encode in one piece: json.dump writes every fragment separately
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
@@ -3,18 +3,54 @@ Repository implementation for PDF documents.
 """
 import os
 import shutil
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 
 import PyPDF2
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 from src.entities.file import File
 from src.infrastructure.repositories.base_document_repository import BaseDocumentRepository
 
 
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+def _extract_pdf_worker(path: str) -> Tuple[Optional[str], Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Extract a PDF's text and metadata in a worker process.
+    
+    Args:
+        path: Path to the PDF file
+        
+    Returns:
+        Tuple of text, metadata and error message; the error is None on
+        success, and the text and metadata are None on failure
+    """
+    try:
+        text, metadata = PDFDocumentRepository._read_pdf(path)
+        return text, metadata, None
+    except Exception as e:
+        return None, None, str(e)
+
+
 class PDFDocumentRepository(BaseDocumentRepository):
     """Repository for handling PDF documents."""
 
+    # PDFs handed to the worker processes at a time by load_documents
+    LOAD_BATCH_SIZE = 500
+    # Pages per File yielded by load_document_streaming
+    STREAM_PAGE_BATCH = 500
+
     def load_document(self, path: str) -> File:
         """
         Load a PDF document from the given path and create a File entity.
@@ -30,36 +66,184 @@ class PDFDocumentRepository(BaseDocumentRepository):
             IOError: If there's an error reading the file
             ValueError: If the file is not a valid PDF
         """
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"File not found: {path}")
-        
-        mime_type = self._get_mime_type(path)
-        if not mime_type.startswith('application/pdf'):
-            raise ValueError(f"Not a PDF file: {path} (MIME type: {mime_type})")
+        self._check_pdf(path)
         
         try:
-            content = self._extract_text_from_pdf(path)
-            metadata = self._extract_metadata_from_pdf(path)
+            content, metadata = self._read_pdf(path)
+        except Exception as e:
+            raise IOError(f"Error reading PDF file: {str(e)}")
+        
+        return self._register(path, content, metadata)
+
+    def load_documents(
+        self, paths: List[str], max_workers: Optional[int] = None
+    ) -> List[File]:
+        """
+        Load several PDF documents, extracting them in parallel processes.
+        
+        PDF parsing is CPU-bound, so the files are spread over worker
+        processes, LOAD_BATCH_SIZE at a time to bound the memory held by
+        extracted text waiting to be collected. Workers are spawned rather
+        than forked, since forking while another thread (such as the
+        embedding warm-up) holds a lock can deadlock them.
+        
+        A file that cannot be read is logged and skipped, however many
+        paths are given; use load_document to have the error raised.
+        
+        Args:
+            paths: Paths to the PDF files
+            max_workers: Number of worker processes (defaults to the CPU count)
             
-            file_id = self._generate_id()
-            filename = os.path.basename(path)
+        Returns:
+            File entities for the documents that were loaded, in input order
             
-            file = File(
-                id=file_id,
-                name=filename,
-                path=path,
-                content=content,
-                file_type="pdf",
-                uploaded_at=datetime.now(),
-                metadata=metadata
-            )
+        Raises:
+            FileNotFoundError: If a file doesn't exist
+            ValueError: If a file is not a PDF
+        """
+        for path in paths:
+            self._check_pdf(path)
+        
+        if len(paths) <= 1:
+            # Not worth starting a worker process for
+            return self._register_extracted(paths, map(_extract_pdf_worker, paths))
+        
+        files = []
+        with ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            for start in range(0, len(paths), self.LOAD_BATCH_SIZE):
+                batch = paths[start:start + self.LOAD_BATCH_SIZE]
+                files.extend(self._register_extracted(
+                    batch, executor.map(_extract_pdf_worker, batch)
+                ))
+        return files
+
+    def _register_extracted(
+        self,
+        paths: List[str],
+        results: Iterable[Tuple[Optional[str], Optional[Dict[str, Any]], Optional[str]]]
+    ) -> List[File]:
+        """
+        Store the results of _extract_pdf_worker for the given paths.
+        
+        Failed extractions are logged and left out.
+        """
+        files = []
+        for path, (content, metadata, error) in zip(paths, results):
+            if error is not None:
+                logger.error("Error reading PDF file %s: %s", path, error)
+                continue
+            files.append(self._register(path, content, metadata))
+        return files
+
+    def load_document_streaming(
+        self, path: str, page_batch: Optional[int] = None
+    ) -> Iterator[File]:
+        """
+        Load a PDF document as a sequence of Files of consecutive pages.
+        
+        Only one batch of page text is held at a time, so peak memory does
+        not grow with the length of the document. Each File carries the
+        document's metadata plus page_start and page_end (1-based,
+        inclusive). The Files are not kept by the repository.
+        
+        Args:
+            path: Path to the PDF file
+            page_batch: Pages per File (defaults to STREAM_PAGE_BATCH)
             
-            self.documents[file_id] = file
-            return file
+        Yields:
+            File entities, in page order
             
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            IOError: If there's an error reading the file
+            ValueError: If the file is not a PDF
+        """
+        self._check_pdf(path)
+        page_batch = page_batch or self.STREAM_PAGE_BATCH
+        filename = os.path.basename(path)
+        
+        try:
+            with self._open_pdf(path) as (metadata, pages):
+                parts = []
+                page_start = 1
+                for page_number, text in enumerate(pages, 1):
+                    parts.append(text)
+                    parts.append("\n\n")
+                    if page_number - page_start + 1 == page_batch:
+                        yield self._page_range_file(
+                            path, filename, parts, metadata, page_start, page_number
+                        )
+                        parts = []
+                        page_start = page_number + 1
+                if parts:
+                    yield self._page_range_file(
+                        path, filename, parts, metadata, page_start, page_number
+                    )
         except Exception as e:
             raise IOError(f"Error reading PDF file: {str(e)}")
 
+    def _page_range_file(
+        self,
+        path: str,
+        filename: str,
+        parts: List[str],
+        metadata: Dict[str, Any],
+        page_start: int,
+        page_end: int
+    ) -> File:
+        """Create the File entity for a range of pages of a PDF."""
+        return File(
+            id=self._generate_id(),
+            name=filename,
+            path=path,
+            content="".join(parts),
+            file_type="pdf",
+            uploaded_at=datetime.now(),
+            metadata={**metadata, "page_start": page_start, "page_end": page_end}
+        )
+
+    def _check_pdf(self, path: str) -> None:
+        """
+        Check that a path exists and holds a PDF.
+        
+        The MIME type is only sniffed for paths without a .pdf extension;
+        a misnamed file then fails when it is read instead.
+        
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is not a PDF
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"File not found: {path}")
+        
+        if os.path.splitext(path)[1].lower() == '.pdf':
+            return
+        
+        mime_type = self._get_mime_type(path)
+        if not mime_type.startswith('application/pdf'):
+            raise ValueError(f"Not a PDF file: {path} (MIME type: {mime_type})")
+
+    def _register(self, path: str, content: str, metadata: Dict[str, Any]) -> File:
+        """Create the File entity for an extracted PDF and store it."""
+        file_id = self._generate_id()
+        filename = os.path.basename(path)
+        
+        file = File(
+            id=file_id,
+            name=filename,
+            path=path,
+            content=content,
+            file_type="pdf",
+            uploaded_at=datetime.now(),
+            metadata=metadata
+        )
+        
+        self.documents[file_id] = file
+        return file
+
     def save_document(self, file: File) -> bool:
         """
         Save a PDF document to storage.
@@ -94,72 +278,166 @@ class PDFDocumentRepository(BaseDocumentRepository):
         except Exception as e:
             raise IOError(f"Error saving PDF file: {str(e)}")
 
-    def _extract_text_from_pdf(self, path: str) -> str:
+    @classmethod
+    def _read_pdf(cls, path: str) -> Tuple[str, Dict[str, Any]]:
         """
-        Extract text content from a PDF file.
+        Extract text content and metadata from a PDF file in one pass.
         
         Args:
             path: Path to the PDF file
             
         Returns:
-            Extracted text content
+            Tuple of extracted text content (each page's text followed by a
+            blank line) and dictionary of metadata
+        """
+        with cls._open_pdf(path) as (metadata, pages):
+            parts = []
+            for text in pages:
+                parts.append(text)
+                parts.append("\n\n")
+            return "".join(parts), metadata
+
+    @classmethod
+    @contextmanager
+    def _open_pdf(cls, path: str) -> Iterator[Tuple[Dict[str, Any], Iterator[str]]]:
         """
-        text = ""
+        Open a PDF file once for its metadata and page text.
+        
+        PDFium (pypdfium2) is used when it is installed, since its native
+        parser is several times faster than PyPDF2; otherwise PyPDF2 is
+        used.
+        
+        Args:
+            path: Path to the PDF file
+            
+        Yields:
+            Tuple of dictionary of metadata and an iterator over the text
+            of each page, valid until the context exits
+        """
+        if pdfium is not None:
+            pdf = pdfium.PdfDocument(path)
+            try:
+                yield cls._pdfium_metadata(pdf), cls._pdfium_pages(pdf)
+            finally:
+                pdf.close()
+            return
+        
         with open(path, 'rb') as file:
             reader = PyPDF2.PdfReader(file)
-            for page_num in range(len(reader.pages)):
-                page = reader.pages[page_num]
-                text += page.extract_text() + "\n\n"
-        return text
+            yield cls._pypdf_metadata(reader), cls._pypdf_pages(reader)
 
-    def _extract_metadata_from_pdf(self, path: str) -> Dict[str, Any]:
+    @staticmethod
+    def _pdfium_pages(pdf: "pdfium.PdfDocument") -> Iterator[str]:
         """
-        Extract metadata from a PDF file.
+        Extract the text of each page with PDFium.
         
         Args:
-            path: Path to the PDF file
+            pdf: Open PDFium document
+            
+        Yields:
+            Text content of each page
+        """
+        for page in pdf:
+            textpage = page.get_textpage()
+            # PDFium ends lines with CRLF; PyPDF2 and the rest of the
+            # pipeline use LF
+            yield textpage.get_text_range().replace("\r\n", "\n")
+            textpage.close()
+            page.close()
+
+    @staticmethod
+    def _pdfium_metadata(pdf: "pdfium.PdfDocument") -> Dict[str, Any]:
+        """
+        Extract metadata with PDFium.
+        
+        Args:
+            pdf: Open PDFium document
             
         Returns:
-            Dictionary of metadata
+            Dictionary of metadata, with the same keys PyPDF2 provides
         """
+        info = pdf.get_metadata_dict(skip_empty=True)
         metadata = {}
-        with open(path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            info = reader.metadata
-            
-            if info:
-                if info.title:
-                    metadata['title'] = info.title
-                if info.author:
-                    metadata['author'] = info.author
-                if info.subject:
-                    metadata['subject'] = info.subject
-                if info.creator:
-                    metadata['creator'] = info.creator
-                if info.producer:
-                    metadata['producer'] = info.producer
-                
-                # Handle dates carefully to avoid format issues
-                try:
-                    if hasattr(info, 'creation_date') and info.creation_date:
-                        if isinstance(info.creation_date, datetime):
-                            metadata['creation_date'] = info.creation_date.isoformat()
-                        else:
-                            metadata['creation_date'] = str(info.creation_date)
-                except Exception:
-                    # Skip date if format is incompatible
-                    pass
-                
+        for key, name in (("title", "Title"), ("author", "Author"),
+                          ("subject", "Subject"), ("creator", "Creator"),
+                          ("producer", "Producer")):
+            if info.get(name):
+                metadata[key] = info[name]
+        
+        # Dates are parsed like PyPDF2 does; unparseable ones are skipped
+        for key, name in (("creation_date", "CreationDate"),
+                          ("modification_date", "ModDate")):
+            if info.get(name):
                 try:
-                    if hasattr(info, 'modification_date') and info.modification_date:
-                        if isinstance(info.modification_date, datetime):
-                            metadata['modification_date'] = info.modification_date.isoformat()
-                        else:
-                            metadata['modification_date'] = str(info.modification_date)
-                except Exception:
-                    # Skip date if format is incompatible
+                    date = datetime.strptime(info[name].replace("'", ""), "D:%Y%m%d%H%M%S%z")
+                    metadata[key] = date.isoformat()
+                except ValueError:
                     pass
+        
+        metadata['page_count'] = len(pdf)
+        return metadata
+
+    @staticmethod
+    def _pypdf_pages(reader: PyPDF2.PdfReader) -> Iterator[str]:
+        """
+        Extract the text of each page with PyPDF2.
+        
+        Args:
+            reader: PyPDF2 reader of the open file
+            
+        Yields:
+            Text content of each page
+        """
+        for page in reader.pages:
+            yield page.extract_text() or ""
+
+    @staticmethod
+    def _pypdf_metadata(reader: PyPDF2.PdfReader) -> Dict[str, Any]:
+        """
+        Extract metadata with PyPDF2.
+        
+        Args:
+            reader: PyPDF2 reader of the open file
             
-            metadata['page_count'] = len(reader.pages)
+        Returns:
+            Dictionary of metadata
+        """
+        metadata = {}
+        info = reader.metadata
+        
+        if info:
+            if info.title:
+                metadata['title'] = info.title
+            if info.author:
+                metadata['author'] = info.author
+            if info.subject:
+                metadata['subject'] = info.subject
+            if info.creator:
+                metadata['creator'] = info.creator
+            if info.producer:
+                metadata['producer'] = info.producer
             
+            # Handle dates carefully to avoid format issues
+            try:
+                if hasattr(info, 'creation_date') and info.creation_date:
+                    if isinstance(info.creation_date, datetime):
+                        metadata['creation_date'] = info.creation_date.isoformat()
+                    else:
+                        metadata['creation_date'] = str(info.creation_date)
+            except Exception:
+                # Skip date if format is incompatible
+                pass
+            
+            try:
+                if hasattr(info, 'modification_date') and info.modification_date:
+                    if isinstance(info.modification_date, datetime):
+                        metadata['modification_date'] = info.modification_date.isoformat()
+                    else:
+                        metadata['modification_date'] = str(info.modification_date)
+            except Exception:
+                # Skip date if format is incompatible
+                pass
+        
+        metadata['page_count'] = len(reader.pages)
+        
         return metadata 
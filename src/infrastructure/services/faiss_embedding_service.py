@@ -5,9 +5,12 @@ This module provides an implementation of the EmbeddingService interface
 using FAISS for document embeddings.
 """
 
+import os
+import shutil
 import logging
+import threading
 import numpy as np
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 from sentence_transformers import SentenceTransformer
 
@@ -15,21 +18,130 @@ from src.interfaces.services.embedding_service import EmbeddingService
 
 logger = logging.getLogger(__name__)
 
+# Loaded models by (model name, device), shared by all service instances
+_MODEL_CACHE: Dict[Tuple[str, Optional[str]], SentenceTransformer] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+# Squared norms this close to 1 are treated as unit length, which float32
+# output from the model always is after normalization
+_UNIT_TOLERANCE = 1e-4
+
 class FAISSEmbeddingService(EmbeddingService):
     """
     Implementation of EmbeddingService using FAISS and SentenceTransformers.
+    
+    Embeddings are returned L2-normalized, so cosine similarity between
+    them is a plain dot product. The similarity methods still accept
+    vectors of any length and normalize them when needed.
     """
     
-    def __init__(self, model_name: str = "sentence-transformers/distiluse-base-multilingual-cased-v1"):
+    # Written last, so a snapshot without it is incomplete and ignored
+    SNAPSHOT_MARKER = ".complete"
+    
+    # Texts encoded per forward pass on each kind of device
+    CPU_BATCH_SIZE = 32
+    GPU_BATCH_SIZE = 128
+    
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/distiluse-base-multilingual-cased-v1",
+        snapshot_dir: Optional[str] = None,
+        device: Optional[str] = None
+    ):
         """
         Initialize the FAISS embedding service.
         
         Args:
             model_name: Name of the sentence transformers model to use
+            snapshot_dir: Directory holding a saved copy of the loaded model;
+                later runs load it from there instead of resolving the model
+                through the Hugging Face Hub
+            device: Torch device to run the model on; defaults to CUDA when
+                available, otherwise CPU
         """
         logger.info(f"Initializing FAISS Embedding Service with model {model_name}")
         self.model_name = model_name
-        self.model = SentenceTransformer(model_name)
+        self.snapshot_path = (
+            os.path.join(snapshot_dir, model_name.replace("/", "--"))
+            if snapshot_dir else None
+        )
+        self.device = device
+        self._model: Optional[SentenceTransformer] = None
+    
+    @property
+    def model(self) -> SentenceTransformer:
+        """
+        Get the model, loading it on first use.
+        
+        Services created with the same model name and device share one
+        loaded copy of the weights.
+        """
+        if self._model is None:
+            key = (self.model_name, self.device)
+            with _MODEL_CACHE_LOCK:
+                model = _MODEL_CACHE.get(key)
+                if model is None:
+                    model = self._to_half(self._load_model())
+                    _MODEL_CACHE[key] = model
+            self._model = model
+        return self._model
+    
+    def _load_model(self) -> SentenceTransformer:
+        """
+        Load the model from its snapshot if present, otherwise by name.
+        
+        A model loaded by name is saved as a snapshot for the next run.
+        Failing to write the snapshot is not fatal.
+        """
+        if self.snapshot_path and os.path.isfile(
+            os.path.join(self.snapshot_path, self.SNAPSHOT_MARKER)
+        ):
+            try:
+                logger.debug(f"Loading model snapshot from {self.snapshot_path}")
+                return SentenceTransformer(self.snapshot_path, device=self.device)
+            except Exception as e:
+                logger.warning(f"Could not load model snapshot, reloading model: {e}")
+        
+        model = SentenceTransformer(self.model_name, device=self.device)
+        
+        if self.snapshot_path:
+            self._save_snapshot(model)
+        
+        return model
+    
+    def _to_half(self, model: SentenceTransformer) -> SentenceTransformer:
+        """
+        Switch a model running on CUDA to FP16 weights.
+        
+        Inference is bound by matmul throughput, which FP16 roughly doubles
+        on tensor-core GPUs. The snapshot is saved before this, so it keeps
+        the original FP32 weights. Models whose layers reject FP16 stay FP32.
+        """
+        if model.device.type != "cuda":
+            return model
+        
+        try:
+            model.half()
+            model.encode("", convert_to_numpy=True)
+        except Exception as e:
+            logger.warning(f"Could not run model in FP16, keeping FP32: {e}")
+            model.float()
+        return model
+    
+    def _save_snapshot(self, model: SentenceTransformer) -> None:
+        """Save the model to snapshot_path, replacing any stale snapshot."""
+        tmp_path = f"{self.snapshot_path}.tmp"
+        try:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            model.save(tmp_path)
+            with open(os.path.join(tmp_path, self.SNAPSHOT_MARKER), "w"):
+                pass
+            shutil.rmtree(self.snapshot_path, ignore_errors=True)
+            os.replace(tmp_path, self.snapshot_path)
+            logger.info(f"Model snapshot saved to {self.snapshot_path}")
+        except Exception as e:
+            logger.warning(f"Could not save model snapshot: {e}")
+            shutil.rmtree(tmp_path, ignore_errors=True)
     
     def get_embeddings(self, texts: List[str]) -> np.ndarray:
         """
@@ -39,14 +151,26 @@ class FAISSEmbeddingService(EmbeddingService):
             texts: List of text strings to generate embeddings for
             
         Returns:
-            Numpy array of embeddings
+            Numpy array of unit-length embeddings
         """
         if not texts:
             logger.warning("Empty text list provided to get_embeddings")
             return np.array([])
         
         logger.debug(f"Generating embeddings for {len(texts)} texts")
-        return self.model.encode(texts, convert_to_numpy=True)
+        model = self.model
+        batch_size = (
+            self.GPU_BATCH_SIZE if model.device.type == "cuda"
+            else self.CPU_BATCH_SIZE
+        )
+        # encode already sorts texts by length to pad each batch minimally
+        return model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+            normalize_embeddings=True
+        )
     
     def get_embedding(self, text: str) -> np.ndarray:
         """
@@ -56,19 +180,27 @@ class FAISSEmbeddingService(EmbeddingService):
             text: Text string to generate embedding for
             
         Returns:
-            Numpy array of the embedding
+            Numpy array of the unit-length embedding
         """
         if not text:
             logger.warning("Empty text provided to get_embedding")
             return np.array([])
         
         logger.debug("Generating embedding for a single text")
-        return self.model.encode(text, convert_to_numpy=True)
+        return self.model.encode(
+            text,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+            normalize_embeddings=True
+        )
     
     def similarity(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
         """
         Calculate cosine similarity between two embeddings.
         
+        For unit-length embeddings, as returned by get_embedding(s), this
+        is the dot product; other vectors are divided by their norms.
+        
         Args:
             embedding1: First embedding
             embedding2: Second embedding
@@ -76,13 +208,46 @@ class FAISSEmbeddingService(EmbeddingService):
         Returns:
             Cosine similarity value
         """
-        # Normalize the embeddings
-        norm1 = np.linalg.norm(embedding1)
-        norm2 = np.linalg.norm(embedding2)
+        if embedding1.size == 0 or embedding2.size == 0:
+            logger.warning("Empty embedding provided to similarity")
+            return 0.0
         
-        if norm1 == 0 or norm2 == 0:
-            logger.warning("Zero norm encountered in similarity calculation")
+        dot = float(np.dot(embedding1, embedding2))
+        squared_norms = float(np.dot(embedding1, embedding1)) * float(np.dot(embedding2, embedding2))
+        if squared_norms == 0:
             return 0.0
+        if abs(squared_norms - 1) > _UNIT_TOLERANCE:
+            dot /= np.sqrt(squared_norms)
+        return dot
+    
+    def similarities(self, embeddings1: np.ndarray, embeddings2: np.ndarray) -> np.ndarray:
+        """
+        Calculate cosine similarities between every pair of two sets of embeddings.
+        
+        Rows that are not unit length are normalized first, so the result
+        matches similarity for every pair.
+        
+        Args:
+            embeddings1: Matrix of embeddings, one per row
+            embeddings2: Matrix of embeddings, one per row
+            
+        Returns:
+            Matrix whose [i, j] entry is the similarity of embeddings1[i]
+            and embeddings2[j]
+        """
+        if embeddings1.size == 0 or embeddings2.size == 0:
+            logger.warning("Empty embeddings provided to similarities")
+            return np.zeros((len(embeddings1), len(embeddings2)), dtype=np.float32)
         
-        # Calculate dot product of normalized vectors (cosine similarity)
-        return np.dot(embedding1, embedding2) / (norm1 * norm2) 
+        # One matrix product instead of a similarity call per pair
+        return self._unit_rows(embeddings1) @ self._unit_rows(embeddings2).T
+    
+    @staticmethod
+    def _unit_rows(embeddings: np.ndarray) -> np.ndarray:
+        """Scale the rows of a matrix to unit length, leaving zero rows as zeros."""
+        squared_norms = np.einsum("ij,ij->i", embeddings, embeddings)
+        if np.all(np.abs(squared_norms - 1) <= _UNIT_TOLERANCE):
+            return embeddings
+        norms = np.sqrt(squared_norms)
+        norms[norms == 0] = np.inf
+        return embeddings / norms[:, np.newaxis] 
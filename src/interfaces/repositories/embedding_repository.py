@@ -23,6 +23,24 @@ class EmbeddingRepository(ABC):
         """
         pass
 
+    def save_embeddings(self, embeddings: List[Embedding]) -> bool:
+        """
+        Save several embeddings to the repository.
+        
+        Implementations can override this to store the whole batch at once;
+        by default each embedding is saved in turn.
+        
+        Args:
+            embeddings: The embeddings to save
+            
+        Returns:
+            True if every embedding was saved successfully, False otherwise
+        """
+        saved = True
+        for embedding in embeddings:
+            saved = self.save_embedding(embedding) and saved
+        return saved
+
     @abstractmethod
     def get_embedding(self, id: str) -> Optional[Embedding]:
         """
@@ -52,6 +70,25 @@ class EmbeddingRepository(ABC):
         """
         pass
 
+    def search_similar_batch(
+        self, query_embeddings: List[List[float]], top_k: int = 5
+    ) -> List[List[Embedding]]:
+        """
+        Search for embeddings similar to each of several queries.
+        
+        Implementations can override this to search all queries at once;
+        by default each query is searched in turn.
+        
+        Args:
+            query_embeddings: The query embedding vectors
+            top_k: Number of similar embeddings to return per query
+            
+        Returns:
+            One list of similar embeddings per query, ordered by similarity
+            (most similar first)
+        """
+        return [self.search_similar(query, top_k) for query in query_embeddings]
+
     @abstractmethod
     def list_embeddings(self) -> List[Embedding]:
         """
@@ -44,6 +44,13 @@ def parse_args():
         help='List of topics for the document'
     )
     
+    parser.add_argument(
+        '--cache-sampled',
+        action='store_true',
+        help='Reuse answers to repeated questions even though sampled '
+             'answers would differ between calls'
+    )
+    
     # Ask question command
     ask_parser = subparsers.add_parser('ask', help='Ask a question')
     ask_parser.add_argument('question', help='Question to ask')
@@ -62,8 +69,13 @@ def parse_args():
     return parser.parse_args()
 
 
-def setup_dependencies() -> Dict[str, Any]:
-    """Set up application dependencies."""
+def setup_dependencies(cache_sampled: bool = False) -> Dict[str, Any]:
+    """
+    Set up application dependencies.
+    
+    Args:
+        cache_sampled: Cache LLM answers to requests with temperature > 0
+    """
     # Check API key
     api_key = os.environ.get('ANTHROPIC_API_KEY')
     if not api_key:
@@ -71,7 +83,7 @@ def setup_dependencies() -> Dict[str, Any]:
         sys.exit(1)
     
     # Initialize services
-    llm_service = ClaudeLLMService(api_key)
+    llm_service = ClaudeLLMService(api_key, cache_sampled=cache_sampled)
     
     # Initialize repositories (placeholder - would be real implementations)
     file_repository = {}  # Placeholder
@@ -106,7 +118,7 @@ def main():
     args = parse_args()
     
     # Set up dependencies
-    dependencies = setup_dependencies()
+    dependencies = setup_dependencies(cache_sampled=args.cache_sampled)
     
     # Create context
     context = Context({
@@ -141,9 +141,14 @@ class EmbeddingGenerationUseCase(EmbeddingService):
                     }
                 )
                 
-                # Save to repository
-                if self.embedding_repository.save_embedding(embedding):
-                    embeddings.append(embedding)
+                embeddings.append(embedding)
+            
+            # Save to repository in one batch
+            if not self.embedding_repository.save_embeddings(embeddings):
+                embeddings = [
+                    e for e in embeddings
+                    if self.embedding_repository.get_embedding(e.id) is not None
+                ]
             
             logger.info(f"Generated {len(embeddings)} embeddings for document {file.id}")
             return embeddings
@@ -3,7 +3,7 @@ Implementation of LLM response generation using Claude.
 """
 import os
 import logging
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 
 from src.entities.topic import Topic
 from src.interfaces.services.llm_service import LLMService
@@ -131,6 +131,48 @@ class ResponseGenerationUseCase(LLMService):
             logger.error(f"Error generating response: {str(e)}")
             raise RuntimeError(f"Failed to generate response: {str(e)}")
 
+    def generate_response_stream(
+        self, 
+        prompt: str, 
+        context: List[str] = None,
+        max_tokens: int = None,
+        temperature: float = None
+    ) -> Iterator[str]:
+        """
+        Generate a response from Claude, yielding text as it is produced.
+        
+        Args:
+            prompt: The main prompt to send to Claude
+            context: List of context passages to include
+            max_tokens: Maximum tokens to generate
+            temperature: Temperature for generation
+            
+        Yields:
+            Fragments of the response text, in order
+            
+        Raises:
+            ValueError: If the prompt is invalid
+            RuntimeError: If the Claude API call fails
+        """
+        try:
+            logger.info("Streaming response with Claude")
+            
+            yield from self.client.generate_response_stream(
+                prompt=prompt,
+                context=context,
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+            
+            logger.info("Successfully streamed response")
+            
+        except ValueError as e:
+            logger.error(f"Invalid input for response generation: {str(e)}")
+            raise ValueError(f"Failed to generate response: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error streaming response: {str(e)}")
+            raise RuntimeError(f"Failed to generate response: {str(e)}")
+
     def generate_question(
         self, 
         topic: Topic, 
@@ -118,4 +118,32 @@ class TestConversation:
         assert conversation.get_metadata("user_id") == "user123"
         
         # Get metadata with non-existing key and default value
-        assert conversation.get_metadata("language", "en") == "en" 
+        assert conversation.get_metadata("language", "en") == "en"
+
+    def test_to_api_messages(self):
+        """Test converting messages to API dicts as the conversation grows."""
+        conversation = Conversation(id="1234")
+        start = datetime.now()
+        conversation.add_message(Message(id="1", content="Hello", role="user", timestamp=start))
+        
+        messages = conversation.to_api_messages()
+        assert messages == [{"role": "user", "content": "Hello"}]
+        
+        # The returned list can be extended without affecting the conversation
+        messages.append({"role": "user", "content": "Extra"})
+        conversation.add_message(Message(
+            id="2", content="Hi", role="assistant", timestamp=start + timedelta(seconds=1)
+        ))
+        assert conversation.to_api_messages() == [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi"},
+        ]
+        
+        # An older message is placed at its chronological position
+        conversation.add_message(Message(
+            id="0", content="First", role="user", timestamp=start - timedelta(seconds=1)
+        ))
+        assert [m["content"] for m in conversation.to_api_messages()] == ["First", "Hello", "Hi"]
+        
+        conversation.clear_messages()
+        assert conversation.to_api_messages() == []
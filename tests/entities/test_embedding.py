@@ -89,4 +89,57 @@ class TestEmbedding:
         
         # Test with different dimensions
         with pytest.raises(ValueError):
-            unit_vector_embedding.cosine_similarity([1.0, 0.0]) 
+            unit_vector_embedding.cosine_similarity([1.0, 0.0])
+    
+    def test_batch_cosine_similarity(self):
+        """Test computing similarities against several embeddings at once."""
+        embeddings = [
+            Embedding(id="a", vector=[1.0, 0.0, 0.0], text="a"),
+            Embedding(id="b", vector=[0.0, 2.0, 0.0], text="b"),
+            Embedding(id="c", vector=[1.0, 1.0, 0.0], text="c"),
+            Embedding(id="d", vector=[0.0, 0.0, 0.0], text="d"),
+        ]
+        
+        similarities = Embedding.batch_cosine_similarity([1.0, 0.0, 0.0], embeddings)
+        assert similarities.tolist() == pytest.approx([1.0, 0.0, 1/math.sqrt(2), 0.0])
+        
+        # Matches the single-vector computation
+        for embedding, similarity in zip(embeddings, similarities):
+            assert embedding.cosine_similarity([1.0, 0.0, 0.0]) == pytest.approx(similarity)
+        
+        # Top-k ordering
+        top = Embedding.most_similar([1.0, 0.0, 0.0], embeddings, top_k=2)
+        assert [embedding.id for embedding, _ in top] == ["a", "c"]
+        
+        # Test with different dimensions
+        with pytest.raises(ValueError):
+            Embedding.batch_cosine_similarity([1.0, 0.0], embeddings)
+    
+    def test_quantization(self):
+        """Test int8 quantization of the embedding vector."""
+        embedding = Embedding(id="q", vector=[0.5, -1.0, 0.25, 0.0], text="q")
+        
+        quantized, scale = embedding.quantize()
+        assert quantized.dtype.name == "int8"
+        assert quantized.tolist() == [64, -127, 32, 0]
+        assert Embedding.dequantize(quantized, scale).tolist() == pytest.approx(
+            embedding.vector, abs=scale
+        )
+        
+        other = Embedding(id="r", vector=[0.4, -0.9, 0.3, 0.1], text="r")
+        assert embedding.quantized_cosine_similarity(other) == pytest.approx(
+            embedding.cosine_similarity(other.vector), abs=1e-2
+        )
+        
+        # Zero vector
+        zero = Embedding(id="z", vector=[0.0, 0.0, 0.0, 0.0], text="z")
+        assert zero.quantized_cosine_similarity(embedding) == 0.0
+    
+    def test_equality(self):
+        """Test that equality compares the vectors too."""
+        embedding = Embedding(id="e", vector=[0.1, 0.2], text="e")
+        
+        assert embedding == Embedding(id="e", vector=[0.1, 0.2], text="e")
+        assert embedding != Embedding(id="e", vector=[0.1, 0.3], text="e")
+        assert embedding != Embedding(id="e", vector=[0.1, 0.2, 0.0], text="e")
+        assert embedding != Embedding(id="e", vector=[0.1, 0.2], text="other")
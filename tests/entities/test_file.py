@@ -60,4 +60,14 @@ class TestFile:
         """Test updating content."""
         new_content = "This content has been updated"
         sample_file.update_content(new_content)
-        assert sample_file.content == new_content 
+        assert sample_file.content == new_content
+        assert sample_file.size == len(new_content)
+    
+    def test_size_non_ascii_content(self, sample_file):
+        """Test the size property counts UTF-8 bytes for non-ASCII text."""
+        sample_file.update_content("Questão de física")
+        assert sample_file.size == len("Questão de física".encode('utf-8'))
+        
+        # Content assigned directly is picked up as well
+        sample_file.content = "ação"
+        assert sample_file.size == 6
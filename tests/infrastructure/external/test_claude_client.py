@@ -0,0 +1,74 @@
+"""
+Unit tests for the batch prompting helpers of the Claude client.
+"""
+import unittest
+
+from src.infrastructure.external.claude_client import (
+    build_batch_prompt, split_batch_response
+)
+
+
+class TestSplitBatchResponse(unittest.TestCase):
+    """Tests for the split_batch_response function."""
+
+    def test_answers_in_order(self):
+        """Test splitting a response with every marker in order."""
+        text = "[1]\nFirst answer\n\n[2]\nSecond answer\n\n[3] Third answer"
+        self.assertEqual(
+            split_batch_response(text, 3),
+            ["First answer", "Second answer", "Third answer"]
+        )
+
+    def test_reordered_markers(self):
+        """Test that answers are placed by marker number, not position."""
+        text = "[2]\nSecond answer\n[3]\nThird answer\n[1]\nFirst answer"
+        self.assertEqual(
+            split_batch_response(text, 3),
+            ["First answer", "Second answer", "Third answer"]
+        )
+
+    def test_missing_marker(self):
+        """Test that a missing answer is None and does not shift the others."""
+        text = "[1]\nFirst answer\n[3]\nThird answer"
+        self.assertEqual(
+            split_batch_response(text, 3),
+            ["First answer", None, "Third answer"]
+        )
+
+    def test_no_markers(self):
+        """Test that a response without markers gives no answers."""
+        self.assertEqual(split_batch_response("Just some text", 2), [None, None])
+
+    def test_text_before_first_marker(self):
+        """Test that text before the first marker is dropped."""
+        text = "Here are the answers:\n\n[1]\nFirst answer\n[2]\nSecond answer"
+        self.assertEqual(
+            split_batch_response(text, 2),
+            ["First answer", "Second answer"]
+        )
+
+    def test_marker_inside_line_is_not_split(self):
+        """Test that a bracketed number in the middle of a line is kept."""
+        text = "[1]\nSee reference [2] for details\n[2]\nSecond answer"
+        self.assertEqual(
+            split_batch_response(text, 2),
+            ["See reference [2] for details", "Second answer"]
+        )
+
+    def test_out_of_range_and_repeated_markers(self):
+        """Test that unknown numbers are ignored and the first answer wins."""
+        text = "[1]\nFirst answer\n[1]\nRepeated\n[5]\nExtra\n[2]\nSecond answer"
+        self.assertEqual(
+            split_batch_response(text, 2),
+            ["First answer", "Second answer"]
+        )
+
+    def test_round_trip_with_prompt_layout(self):
+        """Test splitting a response laid out like the batch prompt."""
+        prompt = build_batch_prompt(["a", "b"], [None, ["ctx"]])
+        response = prompt.split("\n\n", 1)[1]
+        self.assertEqual(split_batch_response(response, 2), ["a", "CONTEXT: ctx\n\nb"])
+
+
+if __name__ == "__main__":
+    unittest.main()
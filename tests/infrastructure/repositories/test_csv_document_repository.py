@@ -1,7 +1,9 @@
 """
 Unit tests for the CSVDocumentRepository.
 """
+import math
 import os
+import shutil
 import tempfile
 import unittest
 from datetime import datetime
@@ -188,3 +190,67 @@ class TestCSVDocumentRepository(unittest.TestCase):
         
         with self.assertRaises(ValueError):
             self.repository.get_table_data("fake-id") 
+
+
+class TestCSVMetadata(unittest.TestCase):
+    """Tests for the metadata extracted from CSV content."""
+
+    def setUp(self):
+        """Set up test environment before each test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = CSVDocumentRepository(os.path.join(self.temp_dir, "storage"))
+
+    def tearDown(self):
+        """Clean up after each test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def load(self, content: str) -> File:
+        """Write CSV content to a file and load it."""
+        path = os.path.join(self.temp_dir, "data.csv")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        return self.repository.load_document(path)
+
+    def test_column_types_cover_every_row(self):
+        """Test that column types are inferred from the whole table."""
+        rows = "".join(f"{i},{i},{i},{'true' if i % 2 else 'false'}\n" for i in range(10))
+        file = self.load("ints,floats,mixed,flags\n" + rows + "10,10.5,text,true\n")
+
+        dtypes = file.metadata["dtypes"]
+        self.assertEqual(dtypes["ints"], "int64")
+        self.assertEqual(dtypes["floats"], "float64")
+        self.assertEqual(dtypes["flags"], "bool")
+        # Text columns are "object", or "str" with pandas' string dtype
+        self.assertIn(dtypes["mixed"], ("object", "str"))
+
+    def test_underscored_numbers_are_text(self):
+        """Test that values like 1_000 are not taken for integers."""
+        file = self.load("amount\n1_000\n2_000\n")
+
+        self.assertIn(file.metadata["dtypes"]["amount"], ("object", "str"))
+
+    def test_empty_cells_are_nan_in_sample(self):
+        """Test that empty cells appear as NaN in the sample."""
+        file = self.load("a,b\n1,\n2,3\n")
+
+        self.assertTrue(math.isnan(file.metadata["sample"][0]["b"]))
+        self.assertEqual(len(file.metadata["sample"]), 2)
+
+    def test_row_count(self):
+        """Test that blank lines are not rows and quoted line breaks stay in one row."""
+        file = self.load(
+            'id,note\n'
+            '1,"first line\nsecond line"\n'
+            '\n'
+            '2,plain\n'
+            '\n'
+            '3,"a\n\nb"\n'
+        )
+
+        self.assertEqual(file.metadata["row_count"], 3)
+        self.assertEqual(file.metadata["sample"][0]["note"], "first line\nsecond line")
+
+    def test_malformed_csv(self):
+        """Test that a malformed CSV raises the invalid-format error."""
+        with self.assertRaisesRegex(ValueError, "Invalid CSV format"):
+            self.load("a,b\n1,2\n3,4,5,6\n")
@@ -0,0 +1,151 @@
+"""
+Unit tests for the FAISSEmbeddingRepository.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import faiss
+import numpy as np
+
+from src.entities.embedding import Embedding
+from src.infrastructure.repositories import faiss_embedding_repository
+from src.infrastructure.repositories.faiss_embedding_repository import (
+    FAISSEmbeddingRepository
+)
+
+
+DIMENSION = 8
+
+
+def make_embedding(id: str, text: str, seed: int) -> Embedding:
+    """Create an embedding with a random vector."""
+    vector = np.random.default_rng(seed).standard_normal(DIMENSION)
+    return Embedding(id=id, vector=vector, text=text)
+
+
+class TestFAISSEmbeddingRepository(unittest.TestCase):
+    """Tests for the FAISSEmbeddingRepository class."""
+
+    def setUp(self):
+        """Set up test environment before each test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.index_path = os.path.join(self.temp_dir, "index")
+
+    def tearDown(self):
+        """Clean up after each test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def open_repository(self) -> FAISSEmbeddingRepository:
+        """Open the repository stored at the test index path."""
+        return FAISSEmbeddingRepository(self.index_path, dimension=DIMENSION)
+
+    def test_update_survives_restart(self):
+        """Test that re-saving an ID is kept after a restart and a compaction."""
+        repository = self.open_repository()
+        repository.save_embedding(make_embedding("a", "old", 1))
+        self.assertTrue(repository.compact())
+        repository.save_embedding(make_embedding("a", "UPDATED", 2))
+
+        repository = self.open_repository()
+        self.assertEqual(repository.get_embedding("a").text, "UPDATED")
+
+        self.assertTrue(repository.compact())
+        repository = self.open_repository()
+        self.assertEqual(repository.get_embedding("a").text, "UPDATED")
+        self.assertEqual(len(repository.list_embeddings()), 1)
+
+    def test_interrupted_compaction_keeps_log_order(self):
+        """Test that a log left behind by a compaction is not replayed twice."""
+        repository = self.open_repository()
+        repository.save_embedding(make_embedding("a", "old", 1))
+        repository.save_embedding(make_embedding("a", "UPDATED", 2))
+
+        # Save the index files without emptying the log
+        self.assertTrue(repository.save_index())
+
+        repository = self.open_repository()
+        self.assertEqual(repository.get_embedding("a").text, "UPDATED")
+        self.assertEqual(repository.index.ntotal, 2)
+
+    def test_crash_before_manifest_keeps_previous_generation(self):
+        """Test that a save interrupted before the switch leaves the old files in use."""
+        repository = self.open_repository()
+        for i in range(3):
+            repository.save_embedding(make_embedding(str(i), f"text {i}", i))
+        self.assertTrue(repository.compact())
+
+        repository.save_embedding(make_embedding("3", "text 3", 3))
+        real_write_json = faiss_embedding_repository.write_json
+
+        def crash_on_manifest(path, data):
+            if path.endswith(".manifest.json"):
+                raise OSError("simulated crash")
+            real_write_json(path, data)
+
+        with mock.patch.object(faiss_embedding_repository, "write_json", crash_on_manifest):
+            self.assertFalse(repository.save_index())
+
+        repository = self.open_repository()
+        self.assertEqual(len(repository.list_embeddings()), 4)
+        for i in range(4):
+            embedding = make_embedding(str(i), f"text {i}", i)
+            results = repository.search_similar(embedding.vector.tolist(), top_k=1)
+            self.assertEqual(results[0].id, str(i))
+
+    def test_search_does_not_modify_stored_embeddings(self):
+        """Test that search scores are returned without changing what is saved."""
+        repository = self.open_repository()
+        embedding = make_embedding("a", "text", 1)
+        repository.save_embedding(embedding)
+
+        results = repository.search_similar(embedding.vector.tolist(), top_k=1)
+        self.assertAlmostEqual(results[0].metadata["score"], 1.0, places=5)
+        self.assertEqual(repository.get_embedding("a").metadata, {})
+
+        self.assertTrue(repository.compact())
+        repository = self.open_repository()
+        self.assertEqual(repository.get_embedding("a").metadata, {})
+
+    def test_quantized_index_recall(self):
+        """Test that the 8-bit index finds most of the exact nearest neighbors."""
+        rng = np.random.default_rng(0)
+        dimension, count, top_k = 64, 2000, 10
+        centers = rng.standard_normal((20, dimension))
+        vectors = centers[rng.integers(0, 20, count)] + 0.3 * rng.standard_normal((count, dimension))
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        queries = vectors[:50] + 0.05 * rng.standard_normal((50, dimension))
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+        repository = FAISSEmbeddingRepository(
+            self.index_path, dimension=dimension, ef_search=128, quantized=True
+        )
+        repository.save_embeddings([
+            Embedding(id=str(i), vector=vectors[i], text="") for i in range(count)
+        ])
+        self.assertIsInstance(faiss.downcast_index(repository.index), faiss.IndexHNSWSQ)
+
+        exact = np.argsort(-(queries @ vectors.T), axis=1)[:, :top_k]
+        results = repository.search_similar_batch(queries.tolist(), top_k)
+        recall = np.mean([
+            len({int(e.id) for e in found} & set(expected)) / top_k
+            for found, expected in zip(results, exact)
+        ])
+        self.assertGreaterEqual(recall, 0.9)
+
+    def test_compaction_removes_previous_generation(self):
+        """Test that only the current generation's files are kept."""
+        repository = self.open_repository()
+        repository.save_embedding(make_embedding("a", "text", 1))
+        self.assertTrue(repository.compact())
+        repository.save_embedding(make_embedding("b", "text", 2))
+        self.assertTrue(repository.compact())
+
+        faiss_files = [f for f in os.listdir(self.temp_dir) if f.endswith(".faiss")]
+        self.assertEqual(faiss_files, ["index.2.faiss"])
+
+
+if __name__ == "__main__":
+    unittest.main()
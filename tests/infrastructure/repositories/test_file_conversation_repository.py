@@ -0,0 +1,76 @@
+"""
+Unit tests for the FileConversationRepository.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.entities.conversation import Conversation, Message
+from src.infrastructure.repositories.file_conversation_repository import (
+    FileConversationRepository
+)
+
+
+class TestFileConversationRepository(unittest.TestCase):
+    """Tests for the FileConversationRepository class."""
+
+    def setUp(self):
+        """Set up test environment before each test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = FileConversationRepository(
+            os.path.join(self.temp_dir, "conversations"),
+            os.path.join(self.temp_dir, "FLIPFLOP.md")
+        )
+        self.conversation = Conversation(id="c1", title="Física", metadata={"tags": ["a"]})
+        self.conversation.add_message(Message(id="m1", content="Olá", role="user"))
+
+    def tearDown(self):
+        """Clean up after each test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        """Test that a saved conversation is loaded back unchanged."""
+        self.assertTrue(self.repository.save_conversation(self.conversation))
+
+        loaded = self.repository.get_conversation("c1")
+        self.assertEqual(loaded, self.conversation)
+
+    def test_changing_returned_conversation_does_not_affect_cache(self):
+        """Test that changes to a loaded conversation are not seen by the next get."""
+        self.repository.save_conversation(self.conversation)
+
+        loaded = self.repository.get_conversation("c1")
+        loaded.title = "Changed"
+        loaded.add_message(Message(id="m2", content="Oi", role="assistant"))
+        loaded.metadata["tags"].append("b")
+
+        reloaded = self.repository.get_conversation("c1")
+        self.assertIsNot(reloaded, loaded)
+        self.assertEqual(reloaded.title, "Física")
+        self.assertEqual([m.id for m in reloaded.messages], ["m1"])
+        self.assertEqual(reloaded.metadata, {"tags": ["a"]})
+
+    def test_changing_saved_conversation_does_not_affect_cache(self):
+        """Test that changing a conversation after saving it needs another save."""
+        self.repository.save_conversation(self.conversation)
+
+        self.conversation.add_message(Message(id="m2", content="Oi", role="assistant"))
+        self.conversation.metadata["tags"].append("b")
+
+        loaded = self.repository.get_conversation("c1")
+        self.assertEqual([m.id for m in loaded.messages], ["m1"])
+        self.assertEqual(loaded.metadata, {"tags": ["a"]})
+
+    def test_listed_conversations_are_copies(self):
+        """Test that conversations from list_recent_conversations are not shared."""
+        self.repository.save_conversation(self.conversation)
+
+        listed = self.repository.list_recent_conversations()
+        listed[0].messages.clear()
+
+        self.assertEqual(len(self.repository.get_conversation("c1").messages), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
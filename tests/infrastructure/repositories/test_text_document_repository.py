@@ -9,7 +9,9 @@ from datetime import datetime
 import pytest
 
 from src.entities.file import File
-from src.infrastructure.repositories.text_document_repository import TextDocumentRepository
+from src.infrastructure.repositories.text_document_repository import (
+    TextDocumentRepository, _count_words
+)
 
 
 class TestTextDocumentRepository(unittest.TestCase):
@@ -164,3 +166,44 @@ class TestTextDocumentRepository(unittest.TestCase):
         
         # Clean up
         os.unlink(temp_path) 
+
+
+@pytest.mark.parametrize("content", [
+    "",
+    "   ",
+    "one",
+    "one two  three",
+    "  leading and trailing  ",
+    "lines\nand\r\nreturns\rtoo\n",
+    "tab\tvertical\x0btab form\x0cfeed",
+    "file\x1cgroup\x1drecord\x1eunit\x1fseparators",
+    "\x1c\x1d\x1e\x1f",
+    "punctuation, counts-as; part.of words!",
+    "não é ASCII",
+    "no-break\u00a0space",
+    "em\u2003space and\u3000ideographic",
+    "line\u2028separator",
+    "zero\u200bwidth is not space",
+])
+def test_count_words_matches_str_split(content):
+    """Test that _count_words agrees with len(content.split())."""
+    assert _count_words(content) == len(content.split())
+
+
+@pytest.mark.parametrize("content, title", [
+    ("# Title\n\nBody text\n", "Title"),
+    ("Intro\n# Title\nBody\n", "Title"),
+    ("Intro\nBody\n# Last Title", "Last Title"),
+    ("# Title\r\nBody\r\n", "Title"),
+    ("Intro\r\n# Title\r\nBody\r\n", "Title"),
+    ("Not a # heading\n# Title\n", "Title"),
+    ("Only inline # markers here\n", None),
+    ("## Subtitle\n# Title\n", "Title"),
+    ("#Title without space\n", None),
+    ("", None),
+])
+def test_markdown_title(tmp_path, content, title):
+    """Test that the title is the first line starting with '# '."""
+    repository = TextDocumentRepository(str(tmp_path))
+    metadata = repository._extract_metadata_from_text(content, "markdown")
+    assert metadata.get("title") == title